@@ -0,0 +1,136 @@
+"""
+Throughput de parse_date_key: a versão antiga (tabelas montadas e regex
+compilada a cada chamada, datetime.now() por item, tupla) contra
+date_keys.parse_date_key (tabelas no módulo, regex pré-compilada, LRU por
+string crua, um "agora" por lote, int empacotado).
+
+    python benchmarks/bench_date_keys.py [N]
+"""
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from date_keys import _parse_cached, current_year, pack_date_key, parse_date_key  # noqa: E402
+from news_item import NO_DATE  # noqa: E402
+
+
+def legacy_parse_date_key(date_str: str):
+    """Cópia da implementação anterior, só para comparação."""
+    s = re.sub(r"\s+", " ", str(date_str).strip())
+
+    period_rank = {
+        "MAD": 0, "MAN": 0, "MNH": 0, "AM": 0,
+        "TAR": 1, "PM": 1,
+        "NTE": 2, "NOI": 2, "NIGHT": 2
+    }
+
+    months = {
+        "JAN": 1, "FEV": 2, "MAR": 3, "ABR": 4, "MAI": 5, "JUN": 6,
+        "JUL": 7, "AGO": 8, "SET": 9, "OUT": 10, "NOV": 11, "DEZ": 12,
+        "FEB": 2, "APR": 4, "MAY": 5, "AUG": 8, "SEP": 9, "OCT": 10, "DEC": 12
+    }
+
+    m = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})\s*([A-Za-z]{2,5})?", s, re.IGNORECASE)
+    if m:
+        day = int(m.group(1))
+        month = int(m.group(2))
+        year = int(m.group(3))
+        if year < 100:
+            year = 2000 + year if year <= 79 else 1900 + year
+        per = (m.group(4) or "").upper()
+        return (year, month, day, period_rank.get(per, -1))
+
+    tokens = s.split(" ")
+    if len(tokens) >= 3:
+        def try_parse_at(idx_day, idx_month, idx_period):
+            try:
+                day = int(re.sub(r"\D", "", tokens[idx_day]))
+                month = months.get(tokens[idx_month].upper()[:3])
+                if not month:
+                    return None
+                per = tokens[idx_period].upper() if idx_period < len(tokens) else ""
+                return (datetime.now().year, month, day, period_rank.get(per, -1))
+            except Exception:
+                return None
+
+        key = try_parse_at(1, 2, 3) if len(tokens) >= 4 else None
+        if key:
+            return key
+        key = try_parse_at(0, 1, 2) if len(tokens) >= 3 else None
+        if key:
+            return key
+    return None
+
+
+WEEKDAYS = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+MONTHS = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez", "Dec", "May"]
+PERIODS = ["MAD", "TAR", "NTE", "PM", ""]
+
+
+def sample_dates(n: int, distinct: int) -> list:
+    rnd = random.Random(7)
+    pool = []
+    for _ in range(distinct):
+        kind = rnd.random()
+        if kind < 0.6:
+            pool.append(f"{rnd.choice(WEEKDAYS)} {rnd.randint(1, 31)} {rnd.choice(MONTHS)} {rnd.choice(PERIODS)}".strip())
+        elif kind < 0.85:
+            pool.append(f"{rnd.randint(1, 31)}.{rnd.randint(1, 12)}.{rnd.randint(0, 99):02d} {rnd.choice(PERIODS)}".strip())
+        elif kind < 0.95:
+            pool.append(f"  {rnd.randint(1, 31)}   {rnd.choice(MONTHS)}  ")
+        else:
+            pool.append(rnd.choice(["—", "sem data", "amanhã", "Qua xx Jan"]))
+    return [rnd.choice(pool) for _ in range(n)]
+
+
+def timeit(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dates = sample_dates(n, distinct=500)
+
+    # mesma ordem/resultado que a versão antiga
+    year = current_year()
+    for d in set(dates):
+        old = legacy_parse_date_key(d)
+        new = parse_date_key(d, year)
+        assert new == (NO_DATE if old is None else pack_date_key(*old)), (d, old, new)
+
+    def run_new():
+        _parse_cached.cache_clear()
+        y = current_year()
+        for d in dates:
+            parse_date_key(d, y)
+
+    def run_new_cold():
+        # sem acerto de cache: mede só o parser pré-compilado
+        y = current_year()
+        for d in dates:
+            _parse_cached.__wrapped__(d, y)
+
+    t_old = timeit(lambda: [legacy_parse_date_key(d) for d in dates])
+    t_cold = timeit(run_new_cold)
+    t_new = timeit(run_new)
+    info = _parse_cached.cache_info()
+
+    print(f"[BENCH] {n} datas ({len(set(dates))} distintas)")
+    print(f"[BENCH] antigo       {t_old * 1000:8.1f}ms  {n / t_old / 1e6:6.2f} M/s")
+    print(f"[BENCH] novo s/ LRU  {t_cold * 1000:8.1f}ms  {n / t_cold / 1e6:6.2f} M/s  ({t_old / t_cold:.1f}x)")
+    print(f"[BENCH] novo c/ LRU  {t_new * 1000:8.1f}ms  {n / t_new / 1e6:6.2f} M/s  ({t_old / t_new:.1f}x)"
+          f"  hits={info.hits} misses={info.misses}")
+
+
+if __name__ == "__main__":
+    main()
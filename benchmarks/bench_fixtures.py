@@ -0,0 +1,54 @@
+"""
+Vazão do gerador de turno e returno (fixture_gen.double_round_robin): só
+gerar as rodadas, e gerar indexando cada uma no ScheduleIndex conforme sai.
+Também confere as restrições (todo par duas vezes, mandos iguais, no máximo
+duas seguidas no mesmo mando).
+
+    python benchmarks/bench_fixtures.py [TIMES ...]
+"""
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixture_gen import double_round_robin, max_venue_run  # noqa: E402
+from schedule_index import ScheduleIndex  # noqa: E402
+
+START, END = "2026-03-29", "2026-12-07"
+
+
+def check(teams, rounds) -> None:
+    n = len(teams)
+    pairs = Counter((m["home"], m["away"]) for r in rounds for m in r["matches"])
+    assert len(pairs) == n * (n - 1) and max(pairs.values()) == 1, "par repetido ou faltando"
+    homes = Counter(m["home"] for r in rounds for m in r["matches"])
+    assert all(v == n - 1 for v in homes.values()), "mandos desiguais"
+    assert max_venue_run(rounds) <= 2, "três seguidas no mesmo mando"
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [20, 100, 250, 500]
+    for n in sizes:
+        teams = [f"Time {i:04d}" for i in range(n)]
+
+        t0 = time.perf_counter()
+        rounds = list(double_round_robin(teams, START, END))
+        t_gen = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        index = ScheduleIndex(teams=[{"id": t, "name": t} for t in teams])
+        for rec in double_round_robin(teams, START, END):
+            index.add_round(rec)
+        t_idx = time.perf_counter() - t0
+
+        check(teams, rounds)
+        n_matches = sum(len(r["matches"]) for r in rounds)
+        print(f"[BENCH] {n:4d} times  {len(rounds):5d} rodadas  {n_matches:7d} jogos  "
+              f"gerar={t_gen * 1000:8.1f}ms ({n_matches / t_gen / 1e6:5.2f}M jogos/s)  "
+              f"gerar+indexar={t_idx * 1000:8.1f}ms ({n_matches / t_idx / 1e6:5.2f}M jogos/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Memória e tempo de sort/filtro: registros em dict (formato antigo de
+normalize_data) contra NewsItem (__slots__, strings internadas, data em int).
+
+    python benchmarks/bench_news_memory.py [N]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from date_keys import pack_date_key  # noqa: E402
+from news_item import NewsItem, content_id  # noqa: E402
+
+CATEGORIES = ["Mensagens", "Competições", "Lesões e Suspensões", "Contratos e Imprensa",
+              "Transferências", "Empregos", "Registos"]
+MONTHS = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
+
+
+def fresh(s: str) -> str:
+    # cópia nova da string, como as que saem do parse do JSON
+    return s.encode("utf-8").decode("utf-8")
+
+
+def raw_feed(n: int) -> list:
+    rnd = random.Random(42)
+    feed = []
+    for i in range(n):
+        m = rnd.randrange(12)
+        feed.append({
+            "date": f"Qua {rnd.randint(1, 28):02d} {MONTHS[m]} TAR",
+            "title": f"Notícia {i}: jogador assina contrato",
+            "description": "Descrição curta da notícia número %d." % i,
+            "category": fresh(rnd.choice(CATEGORIES)),
+            "_key": (2024, m + 1, rnd.randint(1, 28), 1),
+        })
+    return feed
+
+
+def as_dicts(feed):
+    return [{
+        "_id": content_id(r["date"], r["title"], r["category"]),
+        "date": r["date"],
+        "title": r["title"],
+        "description": r["description"],
+        "category": r["category"],
+        "_sort_key": r["_key"],
+    } for r in feed]
+
+
+def as_items(feed):
+    return [NewsItem(content_id(r["date"], r["title"], r["category"]), r["date"], r["title"],
+                     r["description"], r["category"], pack_date_key(*r["_key"])) for r in feed]
+
+
+def measure(build, feed):
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    recs = build(feed)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return recs, used
+
+
+def timeit(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    feed = raw_feed(n)
+
+    dicts, mem_d = measure(as_dicts, feed)
+    items, mem_i = measure(as_items, feed)
+
+    sort_d = timeit(lambda: sorted(dicts, key=lambda r: r["_sort_key"], reverse=True))
+    sort_i = timeit(lambda: sorted(items, key=lambda r: r.sort_key, reverse=True))
+    filt_d = timeit(lambda: [r for r in dicts if r.get("category") == "Empregos"])
+    filt_i = timeit(lambda: [r for r in items if r.category == "Empregos"])
+
+    print(f"[BENCH] {n} registros")
+    print(f"[BENCH] memória  dict={mem_d / 1e6:7.2f}MB  NewsItem={mem_i / 1e6:7.2f}MB  "
+          f"({mem_i / mem_d:.0%}, {(mem_d - mem_i) / n:.0f} B/item a menos)")
+    print(f"[BENCH] sort     dict={sort_d * 1000:7.2f}ms  NewsItem={sort_i * 1000:7.2f}ms")
+    print(f"[BENCH] filtro   dict={filt_d * 1000:7.2f}ms  NewsItem={filt_i * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
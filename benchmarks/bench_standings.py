@@ -0,0 +1,95 @@
+"""
+Classificação em ligas sintéticas: recálculo completo em Python puro
+(replay partida a partida), recálculo vetorizado (numpy/bincount) e
+atualização incremental de um placar (Standings.set_result).
+
+    python benchmarks/bench_standings.py [TIMES] [TEMPORADAS]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import standings  # noqa: E402
+from standings import Standings  # noqa: E402
+
+ROUNDS = 38
+UPDATES = 2000
+
+
+def synthetic_season(n_teams: int, rnd: random.Random) -> list:
+    """ROUNDS rodadas com pareamento aleatório; ~90% dos jogos com placar."""
+    teams = [f"T{i:05d}" for i in range(n_teams)]
+    matches = []
+    for r in range(1, ROUNDS + 1):
+        order = teams[:]
+        rnd.shuffle(order)
+        for i in range(0, n_teams - 1, 2):
+            score = (rnd.randint(0, 4), rnd.randint(0, 4)) if rnd.random() < 0.9 else None
+            matches.append((r, order[i], order[i + 1], score))
+    return teams, matches
+
+
+def build(teams, matches, vectorized: bool) -> Standings:
+    saved = standings.np
+    if not vectorized:
+        standings.np = None
+    try:
+        return Standings(teams, matches)
+    finally:
+        standings.np = saved
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    n_teams = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_seasons = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    if standings.np is None:
+        print("[BENCH] numpy ausente: só o caminho em Python puro")
+
+    rnd = random.Random(42)
+    t_py = t_np = t_inc = 0.0
+    n_matches = 0
+    for _ in range(n_seasons):
+        teams, matches = synthetic_season(n_teams, rnd)
+        n_matches += len(matches)
+
+        py = build(teams, matches, vectorized=False)
+        t_py += best_of(py.recompute)
+
+        st = build(teams, matches, vectorized=standings.np is not None)
+        if st.vectorized:
+            t_np += best_of(st.recompute)
+
+        updates = [rnd.choice(matches) for _ in range(UPDATES)]
+        t0 = time.perf_counter()
+        for r, h, a, _ in updates:
+            st.set_result(r, h, a, (rnd.randint(0, 4), rnd.randint(0, 4)))
+        t_inc += time.perf_counter() - t0
+
+        # o incremental tem que bater com o recálculo completo
+        expected = st.stats.tolist() if st.vectorized else [row[:] for row in st.stats]
+        st.recompute()
+        got = st.stats.tolist() if st.vectorized else st.stats
+        assert got == expected, "set_result divergiu do recálculo"
+
+    per_season = lambda t: t / n_seasons * 1000  # noqa: E731
+    print(f"[BENCH] {n_seasons} temporadas x {n_teams} times ({n_matches} partidas)")
+    print(f"[BENCH] recálculo python   {per_season(t_py):8.2f} ms/temporada")
+    if t_np:
+        print(f"[BENCH] recálculo numpy    {per_season(t_np):8.2f} ms/temporada  ({t_py / t_np:.1f}x)")
+    print(f"[BENCH] set_result         {t_inc / (n_seasons * UPDATES) * 1e6:8.2f} us/placar")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import struct
+import pygame
+
+BG_CACHE_DIR = ".bg_cache"
+
+# Evento postado quando o fundo escalado fica pronto (via FetchWorker).
+BG_LOADED = pygame.event.custom_type()
+
+_MAGIC = b"BGC1"
+_HEADER = struct.Struct("<4sII")
+
+
+def _cache_path(src_path: str, size) -> str | None:
+    try:
+        st = os.stat(src_path)
+    except OSError:
+        return None
+    # chave: arquivo de origem (caminho + mtime + tamanho) e resolução alvo
+    ident = f"{os.path.abspath(src_path)}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}"
+    digest = hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(BG_CACHE_DIR, f"bg_{digest}.raw")
+
+
+def _read_cached(path: str):
+    with open(path, "rb") as f:
+        magic, w, h = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            return None
+        pixels = f.read()
+    if len(pixels) != w * h * 3:
+        return None
+    return pygame.image.frombytes(pixels, (w, h), "RGB")
+
+
+def _write_cached(path: str, surf) -> None:
+    os.makedirs(BG_CACHE_DIR, exist_ok=True)
+    w, h = surf.get_size()
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, w, h))
+        f.write(pygame.image.tobytes(surf, "RGB"))
+    os.replace(tmp, path)
+    # só a versão atual interessa: remove escalas/fontes antigas
+    keep = os.path.basename(path)
+    for name in os.listdir(BG_CACHE_DIR):
+        if name.startswith("bg_") and name != keep:
+            try:
+                os.remove(os.path.join(BG_CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def load_scaled_bg(src_path: str, size):
+    """
+    Fundo já escalado para `size`, sem convert() (pode rodar fora da thread
+    principal). Usa o cache em disco se existir; senão decodifica, aplica
+    smoothscale e grava o cache. Retorna None se não houver imagem.
+    """
+    if not os.path.exists(src_path):
+        return None
+
+    cache = _cache_path(src_path, size)
+    if cache and os.path.exists(cache):
+        try:
+            surf = _read_cached(cache)
+            if surf is not None:
+                return surf
+        except Exception as e:
+            print("[BG] Cache inválido:", e)
+
+    img = pygame.image.load(src_path)
+    if img.get_bitsize() not in (24, 32):
+        img = img.convert(24, 0)
+    surf = pygame.transform.smoothscale(img, size)
+    if cache:
+        try:
+            _write_cached(cache, surf)
+        except Exception as e:
+            print("[BG] Falha ao gravar cache:", e)
+    return surf
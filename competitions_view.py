@@ -1,6 +1,21 @@
 import json
 import os
+from collections import OrderedDict
+from datetime import date, datetime
 import pygame
+from fixture_gen import double_round_robin
+from schedule_index import ScheduleIndex
+from season_sim import simulate_season
+from standings import Standings
+from text_cache import render_text
+
+# Evento com o resultado da simulação de temporada (worker em segundo plano).
+# Atributos: data (dict de season_sim.simulate_season ou None), error, reasons.
+SIM_DONE = pygame.event.custom_type()
+
+ROUND_CACHE_MAX_BYTES = 16 * 1024 * 1024  # mínimo; telas grandes ganham mais (ver set_backdrop)
+ROUND_CACHE_SCREENS = 2  # o limite cobre pelo menos esse nº de telas cheias (32 bits)
+PRERENDER_NEIGHBORS = (1, -1, 2, -2)  # ordem em que as rodadas vizinhas são pré-renderizadas
 
 # -----------------------------
 # Local Colors (Copy from main)
@@ -17,6 +32,83 @@ C_RED_DARK = (120, 0, 0)
 C_PANEL = (18, 18, 18, 180)
 C_PANEL_2 = (15, 15, 15, 210)
 
+def _surf_bytes(surf) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+class RoundCache:
+    """
+    LRU das camadas de conteúdo por rodada (e da tabela), limitado em bytes
+    de pixel como o TextCache. Chave: ("rodada", nº, versão da classificação)
+    ou ("tabela", versão, versão das probabilidades). Cada entrada é
+    (Surface, deslocamento dentro da área do conteúdo).
+    """
+
+    def __init__(self, max_bytes: int = ROUND_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.too_big = 0
+        self._entries = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def touch(self, key) -> None:
+        """Marca como recém-usada (sem contar hit), para sair por último."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def entry_bytes(self, key) -> int:
+        entry = self._entries.get(key)
+        return _surf_bytes(entry[0]) if entry is not None else 0
+
+    def put(self, key, surf, pos=(0, 0)) -> None:
+        size = _surf_bytes(surf)
+        if size > self.max_bytes:
+            if not self.too_big:
+                print(f"[ROUNDS] camada de {size} bytes não cabe no cache ({self.max_bytes} bytes); "
+                      "renderizando sem cache")
+            self.too_big += 1
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= _surf_bytes(old[0])
+        self._entries[key] = (surf, pos)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= _surf_bytes(old[0])
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "too_big": self.too_big,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
 class CompetitionsView:
     def __init__(self, json_path, Sx, Sy, Sf, get_font):
         self.json_path = json_path
@@ -25,43 +117,86 @@ class CompetitionsView:
         self.Sf = Sf
         self.get_font = get_font
         
+        self.index = ScheduleIndex()
+        self.standings = None
         self.data = self.load_data()
         self.current_round = self.find_current_round()
-        self.total_rounds = len(self.data.get("schedule", []))
+        self.total_rounds = len(self.index)
         
         # UI State
         self.hover_prev = False
         self.hover_next = False
-        
+        self.hover_toggle = False
+        self.show_table = False  # False = rodadas, True = classificação + probabilidades
+
+        # probabilidades da simulação (None até o primeiro resultado)
+        self.odds = None
+        self.odds_version = 0
+
+        # Conteúdo por rodada já renderizado (ver set_backdrop / prerender_idle)
+        self.round_cache = RoundCache()
+        self._backdrop = None
+        self._backdrop_token = None
+
         # Cache rects
         self.prev_rect = None
         self.next_rect = None
+        self.toggle_rect = None
 
     def load_data(self):
         try:
             with open(self.json_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
         except Exception as e:
             print(f"Erro ao carregar campeonato: {e}")
-            return {"schedule": []}
+            data = {"schedule": []}
+        # índice montado uma vez: rodada, data -> rodada atual, time -> jogos
+        self.index = ScheduleIndex(teams=data.get("teams", []))
+        rounds = data.get("schedule") or []
+        comp = data.get("competition", {})
+        if not rounds and comp.get("format") == "double_round_robin":
+            # sem tabela no JSON: gera turno e returno e vai indexando rodada a rodada
+            teams = [t.get("name", t.get("id")) for t in data.get("teams", [])]
+            rounds = double_round_robin(teams, comp.get("start_date"), comp.get("end_date"))
+        schedule = []
+        for rec in rounds:
+            self.index.add_round(rec)
+            schedule.append(rec)
+        data["schedule"] = schedule
+        # classificação a partir dos placares do JSON (incremental via set_result)
+        self.standings = Standings.from_competition(data)
+        return data
 
-    def find_current_round(self):
-        # Tenta achar a primeira rodada com data futura ou hoje
-        today = "2026-03-29" # Mock date or use datetime
-        # Na verdade, vamos começar na rodada 1 ou na próxima data válida
-        # Simplificação: Começa na 1
-        return 1
+    def today(self) -> date:
+        # "hoje" no fuso da competição, se houver (senão, o local)
+        tz_name = self.data.get("competition", {}).get("timezone")
+        if tz_name:
+            try:
+                from zoneinfo import ZoneInfo
+                return datetime.now(ZoneInfo(tz_name)).date()
+            except Exception:
+                pass
+        return date.today()
+
+    def find_current_round(self, today=None):
+        # primeira rodada com data de hoje em diante (bisect nas datas ordenadas)
+        current = self.index.current_round(today or self.today())
+        return current if current is not None else 1
 
     def handle_input(self, event):
         if event.type == pygame.MOUSEMOTION:
             mouse_pos = event.pos
             self.hover_prev = self.prev_rect and self.prev_rect.collidepoint(mouse_pos)
             self.hover_next = self.next_rect and self.next_rect.collidepoint(mouse_pos)
+            self.hover_toggle = self.toggle_rect and self.toggle_rect.collidepoint(mouse_pos)
             
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 mouse_pos = event.pos
-                if self.hover_prev:
+                if self.hover_toggle:
+                    self.show_table = not self.show_table
+                    self.hover_prev = self.hover_next = False
+                elif self.hover_prev:
                     self.change_round(-1)
                 elif self.hover_next:
                     self.change_round(1)
@@ -72,33 +207,37 @@ class CompetitionsView:
             self.current_round = new_r
 
     def get_round_data(self, round_num):
-        schedule = self.data.get("schedule", [])
-        for r in schedule:
-            if r.get("round") == round_num:
-                return r
-        return None
+        return self.index.round(round_num)
 
-    def render(self, screen, main_frame_rect):
-        Sx, Sy, Sf = self.Sx, self.Sy, self.Sf
-        FONT_TITLE = self.get_font(Sf(28), bold=True)
-        FONT_SUB = self.get_font(Sf(22), bold=True)
-        FONT_TEXT = self.get_font(Sf(16))
-        FONT_SMALL = self.get_font(Sf(14))
+    def get_team_fixtures(self, team):
+        # [(rodada, partida), ...] do time (id ou nome)
+        return self.index.fixtures(team)
+
+    # -------- simulação (título / top-N / rebaixamento) --------
+    def needs_odds(self) -> bool:
+        return self.odds is None or self.odds["version"] != self.standings.version
+
+    def simulate(self):
+        # roda no worker (thread); o pool de processos fica dentro de simulate_season
+        comp = self.data.get("competition", {})
+        return simulate_season(self.standings,
+                               top_n=comp.get("top_spots", 4),
+                               relegation=comp.get("relegation_spots", 4))
+
+    def set_odds(self, result) -> bool:
+        """Aplica um resultado de simulate(); False se ele já está desatualizado."""
+        if result is None or result["version"] != self.standings.version:
+            return False
+        self.odds = result
+        self.odds_version += 1
+        return True
 
+    def layout(self, main_frame_rect):
+        Sx, Sy = self.Sx, self.Sy
         # Title Area inside main_frame
         # Same padding as news view
         title_rect = pygame.Rect(main_frame_rect.left + Sx(10), main_frame_rect.top + Sy(10), 
                                main_frame_rect.width - Sx(20), Sy(46))
-        
-        # Background for title
-        # Simulate beveled_panel from main
-        pygame.draw.rect(screen, C_RED, title_rect, border_radius=max(2, Sx(3)))
-        pygame.draw.rect(screen, (255, 80, 80), title_rect, max(1, Sx(2)), border_radius=max(2, Sx(3)))
-        pygame.draw.rect(screen, C_BLACK, title_rect.inflate(-Sx(4), -Sy(4)), max(1, Sx(1)), border_radius=max(2, Sx(3)))
-        
-        comp_name = self.data.get("competition", {}).get("name", "Competição")
-        img = FONT_TITLE.render(comp_name, True, C_WHITE)
-        screen.blit(img, img.get_rect(center=title_rect.center))
 
         # Content Area
         content_rect = pygame.Rect(
@@ -107,12 +246,116 @@ class CompetitionsView:
             main_frame_rect.width - Sx(20),
             main_frame_rect.height - Sy(70)
         )
+        return title_rect, content_rect
+
+    def draw_backdrop(self, surface, main_frame_rect):
+        """Partes estáticas (título + painel translúcido), assadas uma vez no backdrop."""
+        Sx, Sy, Sf = self.Sx, self.Sy, self.Sf
+        FONT_TITLE = self.get_font(Sf(28), bold=True)
+        title_rect, content_rect = self.layout(main_frame_rect)
+
+        # Background for title
+        # Simulate beveled_panel from main
+        pygame.draw.rect(surface, C_RED, title_rect, border_radius=max(2, Sx(3)))
+        pygame.draw.rect(surface, (255, 80, 80), title_rect, max(1, Sx(2)), border_radius=max(2, Sx(3)))
+        pygame.draw.rect(surface, C_BLACK, title_rect.inflate(-Sx(4), -Sy(4)), max(1, Sx(1)), border_radius=max(2, Sx(3)))
         
+        comp_name = self.data.get("competition", {}).get("name", "Competição")
+        img = render_text(FONT_TITLE, comp_name, C_WHITE)
+        surface.blit(img, img.get_rect(center=title_rect.center))
+
         # Panel BG
         s = pygame.Surface(content_rect.size, pygame.SRCALPHA)
         s.fill(C_PANEL_2)
-        screen.blit(s, content_rect.topleft)
-        pygame.draw.rect(screen, C_WHITE, content_rect, max(1, Sx(1)))
+        surface.blit(s, content_rect.topleft)
+        pygame.draw.rect(surface, C_WHITE, content_rect, max(1, Sx(1)))
+
+    # -------- cache de rodadas --------
+    def set_backdrop(self, surface, token) -> None:
+        """
+        Backdrop já com as partes estáticas (draw_backdrop), que a tela
+        desenha antes do conteúdo. O cache guarda só a camada de texto/jogos
+        (transparente, do tamanho do que foi desenhado) para ir por cima
+        dele; `token` identifica o fundo (F5, resolução): mudou, o cache é
+        descartado. O limite do cache acompanha o tamanho da tela.
+        """
+        self._backdrop = surface
+        if token != self._backdrop_token:
+            self._backdrop_token = token
+            self.round_cache.clear()
+            w, h = surface.get_size()
+            self.round_cache.max_bytes = max(ROUND_CACHE_MAX_BYTES, ROUND_CACHE_SCREENS * w * h * 4)
+
+    def _body_rect(self, content_rect, nav_y):
+        # área redesenhada por rodada: do topo da navegação ao fim do painel, sem a borda
+        b = max(1, self.Sx(1))
+        return pygame.Rect(content_rect.left + b, nav_y, content_rect.width - 2 * b, content_rect.bottom - b - nav_y)
+
+    def _body_key(self, round_num):
+        if self.show_table:
+            return ("tabela", self.standings.version, self.odds_version)
+        return ("rodada", round_num, self.standings.version)
+
+    def _body_layer(self, round_num, content_rect, nav_y, nav_h):
+        """
+        Camada da rodada (ou da tabela) pronta para blit sobre o backdrop:
+        (Surface SRCALPHA recortada no que foi desenhado, posição na tela).
+        Renderiza no miss.
+        """
+        area = self._body_rect(content_rect, nav_y)
+        key = self._body_key(round_num)
+        entry = self.round_cache.get(key)
+        if entry is None:
+            layer = pygame.Surface(area.size, pygame.SRCALPHA)
+            if self.show_table:
+                self.render_table(layer, content_rect, nav_y, nav_h, origin=area.topleft)
+            else:
+                self.render_round(layer, round_num, content_rect, nav_y, nav_h, origin=area.topleft)
+            box = layer.get_bounding_rect()
+            entry = (layer.subsurface(box).copy(), box.topleft)
+            self.round_cache.put(key, *entry)
+        surf, (dx, dy) = entry
+        return surf, (area.left + dx, area.top + dy)
+
+    def prerender_idle(self, main_frame_rect) -> bool:
+        """
+        Chamado em frames ociosos (thread principal: SDL_ttf não é thread-safe).
+        Renderiza no cache uma rodada vizinha ainda ausente; True se fez algo.
+        Só adianta as vizinhas que cabem no limite junto com a atual, e as
+        marca como recentes antes, para o LRU descartar rodadas distantes e
+        não uma vizinha (senão uma pré-renderização expulsaria a outra).
+        """
+        if self._backdrop is None or self.show_table:
+            return False
+        _, content_rect = self.layout(main_frame_rect)
+        nav_y = content_rect.top + self.Sy(10)
+        nav_h = self.Sy(40)
+
+        # estimativa por rodada: a camada da atual (já renderizada pelo render)
+        per_round = self.round_cache.entry_bytes(self._body_key(self.current_round))
+        if not per_round:
+            area = self._body_rect(content_rect, nav_y)
+            per_round = area.width * area.height * 4
+        fit = max(0, self.round_cache.max_bytes // per_round - 1)
+        window = [self.current_round + d for d in PRERENDER_NEIGHBORS[:fit]]
+        window = [r for r in window if 1 <= r <= self.total_rounds]
+
+        self.round_cache.touch(self._body_key(self.current_round))
+        for r in window:
+            self.round_cache.touch(self._body_key(r))
+        for r in window:
+            if self._body_key(r) not in self.round_cache:
+                self._body_layer(r, content_rect, nav_y, nav_h)
+                return True
+        return False
+
+    def render(self, screen, main_frame_rect):
+        # título e painel já estão no backdrop (draw_backdrop)
+        Sx, Sy, Sf = self.Sx, self.Sy, self.Sf
+        FONT_SUB = self.get_font(Sf(22), bold=True)
+        FONT_SMALL = self.get_font(Sf(14))
+
+        title_rect, content_rect = self.layout(main_frame_rect)
 
         # Round Navigation
         nav_h = Sy(40)
@@ -120,6 +363,27 @@ class CompetitionsView:
         
         center_x = content_rect.centerx
         btn_w = Sx(40)
+
+        # Conteúdo da rodada/tabela: camada em cache (só muda com a rodada ou os dados)
+        if self._backdrop is not None:
+            layer, pos = self._body_layer(self.current_round, content_rect, nav_y, nav_h)
+            screen.blit(layer, pos)
+        elif self.show_table:
+            self.render_table(screen, content_rect, nav_y, nav_h)
+        else:
+            self.render_round(screen, self.current_round, content_rect, nav_y, nav_h)
+
+        # Toggle rodadas / classificação
+        self.toggle_rect = pygame.Rect(content_rect.right - Sx(10) - Sx(90), nav_y + Sy(6), Sx(90), nav_h - Sy(12))
+        col = (200, 200, 200) if self.hover_toggle else (150, 150, 150)
+        pygame.draw.rect(screen, col, self.toggle_rect, border_radius=Sx(4))
+        pygame.draw.rect(screen, C_BLACK, self.toggle_rect, max(1, Sx(1)), border_radius=Sx(4))
+        txt = render_text(FONT_SMALL, "Rodadas" if self.show_table else "Tabela", C_BLACK)
+        screen.blit(txt, txt.get_rect(center=self.toggle_rect.center))
+
+        if self.show_table:
+            self.prev_rect = self.next_rect = None
+            return
         
         # Prev (<)
         self.prev_rect = pygame.Rect(center_x - Sx(100) - btn_w, nav_y, btn_w, nav_h)
@@ -131,18 +395,28 @@ class CompetitionsView:
             col = (200, 200, 200) if hover else (150, 150, 150)
             pygame.draw.rect(screen, col, rect, border_radius=Sx(4))
             pygame.draw.rect(screen, C_BLACK, rect, max(1, Sx(1)), border_radius=Sx(4))
-            txt = FONT_SUB.render(sym, True, C_BLACK)
+            txt = render_text(FONT_SUB, sym, C_BLACK)
             screen.blit(txt, txt.get_rect(center=rect.center))
 
+    def render_round(self, surface, round_num, content_rect, nav_y, nav_h, origin=(0, 0)):
+        """Rótulo, data e jogos da rodada; coordenadas de tela menos `origin`."""
+        Sx, Sy, Sf = self.Sx, self.Sy, self.Sf
+        FONT_SUB = self.get_font(Sf(22), bold=True)
+        FONT_TEXT = self.get_font(Sf(16))
+        FONT_SMALL = self.get_font(Sf(14))
+        ox, oy = origin
+        center_x = content_rect.centerx - ox
+        nav_y -= oy
+
         # Round Text
-        r_data = self.get_round_data(self.current_round)
+        r_data = self.get_round_data(round_num)
         r_date = r_data.get("date", "---") if r_data else "---"
         
-        lbl = FONT_SUB.render(f"Rodada {self.current_round}", True, C_YELLOW)
-        screen.blit(lbl, lbl.get_rect(center=(center_x, nav_y + nav_h//2 - Sy(8))))
+        lbl = render_text(FONT_SUB, f"Rodada {round_num}", C_YELLOW)
+        surface.blit(lbl, lbl.get_rect(center=(center_x, nav_y + nav_h//2 - Sy(8))))
         
-        lbl_date = FONT_SMALL.render(r_date, True, C_GRAY)
-        screen.blit(lbl_date, lbl_date.get_rect(center=(center_x, nav_y + nav_h//2 + Sy(12))))
+        lbl_date = render_text(FONT_SMALL, r_date, C_GRAY)
+        surface.blit(lbl_date, lbl_date.get_rect(center=(center_x, nav_y + nav_h//2 + Sy(12))))
 
         # Matches List
         if not r_data:
@@ -159,20 +433,83 @@ class CompetitionsView:
             # Simple row layout:  Home [ vs ] Away
             # Home right aligned, Away left aligned
             
-            mid = content_rect.centerx
+            mid = center_x
             gap = Sx(20)
             
-            txt_home = FONT_TEXT.render(home, True, C_WHITE)
-            txt_away = FONT_TEXT.render(away, True, C_WHITE)
-            txt_vs = FONT_SMALL.render("vs", True, C_GRAY)
+            txt_home = render_text(FONT_TEXT, home, C_WHITE)
+            txt_away = render_text(FONT_TEXT, away, C_WHITE)
+            score = self.standings.result(round_num, home, away)
+            if score:
+                txt_vs = render_text(FONT_SMALL, f"{score[0]} x {score[1]}", C_YELLOW)
+            else:
+                txt_vs = render_text(FONT_SMALL, "vs", C_GRAY)
             
-            screen.blit(txt_home, (mid - gap - txt_home.get_width(), list_y))
-            screen.blit(txt_vs, (mid - txt_vs.get_width()//2, list_y + Sy(2)))
-            screen.blit(txt_away, (mid + gap, list_y))
+            surface.blit(txt_home, (mid - gap - txt_home.get_width(), list_y))
+            surface.blit(txt_vs, (mid - txt_vs.get_width()//2, list_y + Sy(2)))
+            surface.blit(txt_away, (mid + gap, list_y))
             
             # Decor line
             line_y = list_y + row_h - Sy(5)
-            pygame.draw.line(screen, (50, 50, 50), (content_rect.left + Sx(20), line_y), (content_rect.right - Sx(20), line_y))
+            pygame.draw.line(surface, (50, 50, 50), (content_rect.left - ox + Sx(20), line_y), (content_rect.right - ox - Sx(20), line_y))
             
             list_y += row_h
 
+    def render_table(self, screen, content_rect, nav_y, nav_h, origin=(0, 0)):
+        Sx, Sy, Sf = self.Sx, self.Sy, self.Sf
+        FONT_SUB = self.get_font(Sf(22), bold=True)
+        FONT_SMALL = self.get_font(Sf(14))
+        FONT_ROW = self.get_font(Sf(13))
+        ox, oy = origin
+        content_rect = content_rect.move(-ox, -oy)
+        nav_y -= oy
+        center_x = content_rect.centerx
+        odds = self.odds
+
+        lbl = render_text(FONT_SUB, "Classificação", C_YELLOW)
+        screen.blit(lbl, lbl.get_rect(center=(center_x, nav_y + nav_h//2 - Sy(8))))
+        status = f"{odds['runs']} temporadas simuladas" if odds else "simulando temporadas..."
+        lbl_status = render_text(FONT_SMALL, status, C_GRAY)
+        screen.blit(lbl_status, lbl_status.get_rect(center=(center_x, nav_y + nav_h//2 + Sy(12))))
+
+        # colunas: (cabeçalho, borda direita como fração da largura; None = alinhado à esquerda)
+        top_n = odds["top_n"] if odds else self.data.get("competition", {}).get("top_spots", 4)
+        cols = [("#", 0.06), ("Time", None), ("J", 0.50), ("Pts", 0.58), ("SG", 0.66),
+                ("Título", 0.77), (f"Top {top_n}", 0.87), ("Rebx.", 0.97)]
+        left = content_rect.left + Sx(10)
+        width = content_rect.width - Sx(20)
+        team_x = left + int(width * 0.09)
+
+        def put(text, color, right_frac, y, font):
+            img = render_text(font, text, color)
+            if right_frac is None:
+                screen.blit(img, (team_x, y))
+            else:
+                screen.blit(img, (left + int(width * right_frac) - img.get_width(), y))
+
+        def pct(p):
+            if p <= 0:
+                return "-"
+            if p < 0.001:
+                return "<0.1%"
+            return f"{p * 100:.1f}%"
+
+        row_h = Sy(20)
+        y = nav_y + nav_h + Sy(8)
+        for name, frac in cols:
+            put(name, C_GRAY, frac, y, FONT_ROW)
+        pygame.draw.line(screen, (80, 80, 80), (left, y + row_h - Sy(3)), (left + width, y + row_h - Sy(3)))
+        y += row_h
+
+        user_team = self.data.get("competition", {}).get("user_team")
+        odds_idx = {t: i for i, t in enumerate(odds["teams"])} if odds else {}
+        for row in self.standings.table():
+            color = C_YELLOW if row["team"] == user_team else C_WHITE
+            i = odds_idx.get(row["team"])
+            cells = [str(row["pos"]), row["team"], str(row["played"]), str(row["points"]), f"{row['gd']:+d}"]
+            if i is not None:
+                cells += [pct(odds["title"][i]), pct(odds["top"][i]), pct(odds["relegation"][i])]
+            else:
+                cells += ["...", "...", "..."]
+            for (name, frac), text in zip(cols, cells):
+                put(text, color, frac, y, FONT_ROW)
+            y += row_h
@@ -0,0 +1,94 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+
+from news_item import NO_DATE
+
+# -----------------------------
+# Tabelas e padrões (montados uma vez, no import)
+# -----------------------------
+PERIOD_RANK = {
+    "MAD": 0, "MAN": 0, "MNH": 0, "AM": 0,
+    "TAR": 1, "PM": 1,
+    "NTE": 2, "NOI": 2, "NIGHT": 2
+}
+
+MONTHS = {
+    # PT
+    "JAN": 1, "FEV": 2, "MAR": 3, "ABR": 4, "MAI": 5, "JUN": 6,
+    "JUL": 7, "AGO": 8, "SET": 9, "OUT": 10, "NOV": 11, "DEZ": 12,
+    # EN
+    "FEB": 2, "APR": 4, "MAY": 5, "AUG": 8, "SEP": 9, "OCT": 10, "DEC": 12
+}
+
+# formato numérico: d.m.yy + período
+_NUMERIC_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})\s*([A-Za-z]{2,5})?", re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r"\D")
+
+DATE_CACHE_SIZE = 4096
+
+
+def pack_date_key(year: int, month: int, day: int, period: int) -> int:
+    """
+    (ano, mês, dia, período) -> int com a mesma ordem da tupla:
+    ((ano*100 + mês)*100 + dia)*4 + (período+1). Dia/mês fora de 0..99
+    (lixo no feed) são limitados a 99 para não invadir o campo vizinho.
+    """
+    return ((year * 100 + min(month, 99)) * 100 + min(day, 99)) * 4 + (period + 1)
+
+
+def current_year() -> int:
+    """Ano usado para datas sem ano; pegue uma vez por lote de normalização."""
+    return datetime.now().year
+
+
+def _parse_tokens(tokens, idx_day, idx_month, idx_period, year):
+    try:
+        day = int(_NON_DIGIT_RE.sub("", tokens[idx_day]))
+    except ValueError:
+        return None
+    month = MONTHS.get(tokens[idx_month].upper()[:3])
+    if not month:
+        return None
+    per = tokens[idx_period].upper() if idx_period < len(tokens) else ""
+    # sem ano -> ano do lote ("agora")
+    return pack_date_key(year, month, day, PERIOD_RANK.get(per, -1))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_cached(date_str: str, year: int) -> int:
+    s = " ".join(date_str.split())
+
+    m = _NUMERIC_RE.search(s)
+    if m:
+        day = int(m.group(1))
+        month = int(m.group(2))
+        y = int(m.group(3))
+        if y < 100:
+            y = 2000 + y if y <= 79 else 1900 + y
+        per = (m.group(4) or "").upper()
+        return pack_date_key(y, month, day, PERIOD_RANK.get(per, -1))
+
+    tokens = s.split(" ")
+    if len(tokens) >= 4:
+        key = _parse_tokens(tokens, 1, 2, 3, year)
+        if key is not None:
+            return key
+    if len(tokens) >= 3:
+        key = _parse_tokens(tokens, 0, 1, 2, year)
+        if key is not None:
+            return key
+    return NO_DATE
+
+
+def parse_date_key(date_str, year: int | None = None) -> int:
+    """
+    Converte strings do tipo:
+      - "Qui 13 Jan NTE"
+      - "Qua 31 Dez TAR"
+      - "25.9.04 TAR"
+    em uma chave ordenável (int, ver pack_date_key). Se falhar, NO_DATE.
+    `year` é o ano para datas sem ano (padrão: o atual); o resultado é
+    memoizado por (string crua, ano).
+    """
+    return _parse_cached(str(date_str), current_year() if year is None else year)
@@ -0,0 +1,34 @@
+_MISSING = object()
+
+
+class DirtyRegions:
+    """
+    Rastreia quais regiões da tela mudaram desde o último frame.
+
+    Cada frame o loop passa a lista (nome, rect, assinatura), onde a
+    assinatura é uma tupla barata com o estado que afeta aquela região
+    (hover, seleção, texto do filtro...). Só as regiões cuja assinatura
+    mudou voltam como sujas. Depois de invalidate() o próximo frame é
+    desenhado inteiro.
+    """
+
+    def __init__(self):
+        self._sigs = {}
+        self.full = True
+
+    def invalidate(self) -> None:
+        self.full = True
+
+    def collect(self, regions):
+        """Retorna None para redesenho completo, senão a lista de rects sujos (pode ser vazia)."""
+        if self.full:
+            self.full = False
+            self._sigs = {name: sig for name, _, sig in regions}
+            return None
+
+        dirty = []
+        for name, rect, sig in regions:
+            if self._sigs.get(name, _MISSING) != sig:
+                self._sigs[name] = sig
+                dirty.append(rect)
+        return dirty
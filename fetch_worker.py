@@ -0,0 +1,102 @@
+import threading
+import pygame
+
+# Evento postado na fila do pygame quando um fetch termina.
+# Atributos: data (dict normalizado ou None), error (Exception ou None),
+# reasons (lista de motivos que foram agrupados neste fetch).
+FEED_LOADED = pygame.event.custom_type()
+
+# Evento com um resultado parcial (primeira tela de um download em streaming).
+# Mesmos atributos de FEED_LOADED; reasons == ["parcial"].
+FEED_PARTIAL = pygame.event.custom_type()
+
+
+def post_feed_partial(data: dict) -> None:
+    """Entrega dados parciais ao loop principal (pode ser chamada de qualquer thread)."""
+    try:
+        pygame.event.post(pygame.event.Event(FEED_PARTIAL, {
+            "data": data,
+            "error": None,
+            "reasons": ["parcial"],
+        }))
+    except pygame.error:
+        pass  # display já foi encerrado
+
+
+class FetchWorker:
+    """
+    Executa o download + normalize_data fora da thread principal.
+
+    Uma única thread daemon atende os pedidos. Pedidos feitos enquanto já há
+    um fetch pendente ou em andamento são agrupados nele (coalescing), então
+    uma rajada de cliques gera uma única requisição. O resultado volta para o
+    loop principal como um evento FEED_LOADED (ou `event_type`, quando o
+    worker é usado para outro trabalho pesado, como o fundo escalado).
+    """
+
+    def __init__(self, fetch_fn, event_type=FEED_LOADED, name="feed-fetch"):
+        self.fetch_fn = fetch_fn
+        self.event_type = event_type
+
+        self._cond = threading.Condition()
+        self._pending = False
+        self._busy = False
+        self._reasons = []
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self._pending or self._busy
+
+    def request(self, reason: str = "") -> bool:
+        """Agenda um fetch. Retorna False se foi agrupado num fetch já existente."""
+        with self._cond:
+            if reason:
+                self._reasons.append(reason)
+            if self._pending or self._busy:
+                return False
+            self._pending = True
+            self._cond.notify()
+            return True
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                self._pending = False
+                self._busy = True
+
+            data, error = None, None
+            try:
+                data = self.fetch_fn()
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                reasons = self._reasons
+                self._reasons = []
+                self._busy = False
+                if self._stopped:
+                    return
+
+            try:
+                pygame.event.post(pygame.event.Event(self.event_type, {
+                    "data": data,
+                    "error": error,
+                    "reasons": reasons,
+                }))
+            except pygame.error as e:
+                # display já foi encerrado
+                print(f"[{self._thread.name}] Resultado descartado:", e)
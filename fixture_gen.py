@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+from schedule_index import parse_round_date
+
+ROUND_INTERVAL_DAYS = 7  # sem end_date: uma rodada por semana
+
+
+def _circle_round(n: int, r: int) -> list:
+    """
+    Rodada `r` (0..n-2) do turno pelo método do círculo, com n par: a posição
+    0 fica fixa e as demais giram uma casa por rodada. Mando: o fixo alterna
+    por rodada; os outros pela paridade da posição, que muda a cada giro, então
+    ninguém joga mais de duas seguidas em casa (ou fora) dentro do turno.
+    -> [(casa, fora), ...] em índices de 0..n-1.
+    """
+    m = n - 1
+    pos = [0] + [1 + (r + i) % m for i in range(m)]
+    pairs = []
+    for i in range(n // 2):
+        a, b = pos[i], pos[n - 1 - i]
+        home_first = (r % 2 == 0) if i == 0 else (i % 2 == 1)
+        pairs.append((a, b) if home_first else (b, a))
+    return pairs
+
+
+def round_dates(count: int, start_date=None, end_date=None) -> list:
+    """
+    Datas ISO de `count` rodadas: distribuídas por igual entre start_date e
+    end_date, ou semanais a partir de start_date. Sem start_date: None.
+    """
+    start = parse_round_date(start_date)
+    if start is None or count <= 0:
+        return [None] * count
+    end = parse_round_date(end_date)
+    if end is None or end < start or count == 1:
+        return [(start + timedelta(days=ROUND_INTERVAL_DAYS * i)).isoformat() for i in range(count)]
+    span = (end - start).days
+    return [(start + timedelta(days=round(i * span / (count - 1)))).isoformat() for i in range(count)]
+
+
+def double_round_robin(teams, start_date=None, end_date=None, first_round: int = 1):
+    """
+    Gera, rodada a rodada, um turno e returno (método do círculo):
+      - todo par se enfrenta duas vezes, uma com cada mando;
+      - cada time tem o mesmo número de jogos em casa e fora (nº par de times);
+      - ninguém joga três seguidas em casa nem três seguidas fora;
+      - o returno começa pelo espelho da 2ª rodada, então não há revanche
+        imediata na virada de turno.
+    Com nº ímpar de times, a folga ocupa a posição fixa do círculo.
+
+    É um gerador de registros {"round", "date", "matches": [{"home", "away"}]},
+    no formato do campeonato.json, para ir direto para ScheduleIndex.add_round
+    sem montar a tabela inteira antes.
+    """
+    teams = list(teams)
+    if len(teams) < 2:
+        return
+    slots = ([None] + teams) if len(teams) % 2 else teams  # None = folga
+    n = len(slots)
+    per_half = n - 1
+    dates = round_dates(2 * per_half, start_date, end_date)
+
+    # returno: espelho das rodadas 2..n-1 e por fim da 1ª
+    order = list(range(per_half)) + [(r + 1) % per_half for r in range(per_half)]
+    for k, r in enumerate(order):
+        mirrored = k >= per_half
+        matches = []
+        for h, a in _circle_round(n, r):
+            if mirrored:
+                h, a = a, h
+            home, away = slots[h], slots[a]
+            if home is None or away is None:
+                continue
+            matches.append({"home": home, "away": away})
+        rec = {"round": first_round + k, "matches": matches}
+        if dates[k] is not None:
+            rec["date"] = dates[k]
+        yield rec
+
+
+def max_venue_run(rounds) -> int:
+    """Maior sequência de jogos seguidos no mesmo mando, entre todos os times."""
+    last, run, worst = {}, {}, 0
+    for rec in rounds:
+        for m in rec.get("matches", []):
+            for team, venue in ((m["home"], 1), (m["away"], 0)):
+                run[team] = run.get(team, 0) + 1 if last.get(team) == venue else 1
+                last[team] = venue
+                worst = max(worst, run[team])
+    return worst
+
@@ -0,0 +1,64 @@
+import pygame
+
+
+class FontRegistry:
+    """
+    Registro compartilhado de fontes.
+
+    pygame.font.SysFont varre as fontes do sistema a cada chamada; aqui o
+    arquivo da família é resolvido uma vez (regular e negrito), os objetos
+    Font ficam guardados por (tamanho, negrito) e o melhor tamanho para
+    caber um texto num retângulo é memorizado.
+    """
+
+    def __init__(self, name: str = "arial"):
+        self.name = name
+        self._paths = {}
+        self._fonts = {}
+        self._fits = {}
+
+    def _resolve(self, bold: bool):
+        # (caminho, precisa de negrito sintético)
+        if bold not in self._paths:
+            path = pygame.font.match_font(self.name, bold=bold)
+            fake_bold = bold and (path is None or path == pygame.font.match_font(self.name, bold=False))
+            self._paths[bold] = (path, fake_bold)
+        return self._paths[bold]
+
+    def get(self, size: int, bold: bool = False):
+        key = (size, bold)
+        f = self._fonts.get(key)
+        if f is None:
+            path, fake_bold = self._resolve(bold)
+            f = pygame.font.Font(path, size)
+            if fake_bold:
+                f.set_bold(True)
+            self._fonts[key] = f
+        return f
+
+    def fit_multiline(self, lines, max_w, max_h, start_px, bold=False, min_px=10):
+        """Maior fonte (de start_px até min_px) em que todas as linhas cabem em max_w x max_h."""
+        key = (tuple(lines), max_w, max_h, start_px, bold, min_px)
+        px = self._fits.get(key)
+        if px is None:
+            px = min_px
+            for cand in range(start_px, min_px - 1, -1):
+                f = self.get(cand, bold=bold)
+                total_h = f.get_linesize() * len(lines)
+                widest = max((f.size(ln)[0] for ln in lines), default=0)
+                if widest <= max_w and total_h <= max_h:
+                    px = cand
+                    break
+            self._fits[key] = px
+        return self.get(px, bold=bold)
+
+    def clear(self) -> None:
+        self._paths.clear()
+        self._fonts.clear()
+        self._fits.clear()
+
+
+FONTS = FontRegistry()
+
+def get_font(size, bold=False):
+    return FONTS.get(size, bold=bold)
@@ -0,0 +1,326 @@
+import gzip
+import http.client
+import threading
+import time
+import zlib
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_TIMEOUT_SEC = 6
+USER_AGENT = "ui_news_layout/1.0"
+
+# erros típicos de conexão keep-alive que o servidor já fechou
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class HTTPStatusError(http.client.HTTPException):
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class HTTPResponseData:
+    def __init__(self, status: int, headers, body: bytes):
+        self.status = status
+        self.headers = headers  # http.client.HTTPMessage (get() sem diferenciar maiúsculas)
+        self.body = body
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HTTPStatusError(self.status)
+
+    def text(self) -> str:
+        try:
+            return self.body.decode("utf-8")
+        except Exception:
+            return self.body.decode("latin-1", errors="replace")
+
+
+def _decode_body(raw: bytes, encoding: str | None) -> bytes:
+    enc = (encoding or "").strip().lower()
+    if enc == "gzip":
+        return gzip.decompress(raw)
+    if enc == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)  # deflate "cru"
+    return raw
+
+
+def _body_decoder(encoding: str | None):
+    enc = (encoding or "").strip().lower()
+    if enc == "gzip":
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if enc == "deflate":
+        return zlib.decompressobj()
+    return None
+
+
+class StreamingResponse:
+    """
+    Resposta cujo corpo é lido aos pedaços (iter_chunks), já descomprimido.
+    A conexão volta ao pool só se o corpo foi lido até o fim (respostas sem
+    corpo já nascem completas); close() antes disso descarta a conexão.
+    """
+
+    def __init__(self, pool, key, conn, resp, chunk_size: int):
+        self.status = resp.status
+        self.headers = resp.headers
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+        self._chunk_size = chunk_size
+        self._complete = False
+        # sem corpo (304, 204, HEAD, Content-Length: 0): o read() só fecha a
+        # resposta no http.client, e a conexão pode voltar ao pool
+        if resp.length == 0:
+            resp.read()
+            self._complete = True
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HTTPStatusError(self.status)
+
+    def iter_chunks(self):
+        enc = self.headers.get("Content-Encoding")
+        decomp = _body_decoder(enc)
+        limit = self._chunk_size  # limita a saída descomprimida de cada pedaço
+        first = True
+        while True:
+            raw = self._resp.read(self._chunk_size)
+            if not raw:
+                break
+            with self._pool._lock:
+                self._pool.bytes_in += len(raw)
+            if decomp is None:
+                yield raw
+                continue
+            try:
+                out = decomp.decompress(raw, limit)
+            except zlib.error:
+                if not first or "deflate" not in (enc or "").lower():
+                    raise
+                decomp = zlib.decompressobj(-zlib.MAX_WBITS)  # deflate "cru"
+                out = decomp.decompress(raw, limit)
+            first = False
+            while True:
+                if out:
+                    yield out
+                if not decomp.unconsumed_tail:
+                    break
+                out = decomp.decompress(decomp.unconsumed_tail, limit)
+        if decomp is not None:
+            tail = decomp.flush()
+            if tail:
+                yield tail
+        self._complete = True
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        if self._complete:
+            self._pool._finish(self._key, self._conn, self._resp)
+        else:
+            self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HTTPPool:
+    """
+    Pool de conexões persistentes (http.client) por (esquema, host, porta).
+
+    Cada requisição pega uma conexão ociosa do host (ou abre uma nova), pede
+    gzip/deflate e devolve a conexão ao pool se o servidor não pediu para
+    fechar. Se uma conexão reaproveitada já tinha sido fechada pelo servidor,
+    a requisição é refeita uma vez numa conexão nova. Pode ser usado por
+    várias threads; cada conexão só é usada por uma de cada vez.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_SEC, max_idle_per_host: int = 2, max_redirects: int = 3):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self._idle = {}
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.sends = 0
+        self.reused = 0
+        self.connections_opened = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.total_latency = 0.0
+
+    # -------- conexões --------
+    def _acquire(self, key, timeout):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return cls(host, port, timeout=timeout), False
+
+    def _release(self, key, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for c in conns:
+            c.close()
+
+    # -------- requisições --------
+    def _open(self, method, url, body, headers, timeout):
+        """Envia a requisição e devolve (key, conn, resp, reused) com o corpo ainda não lido."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        hdrs = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        hdrs.update(headers or {})
+
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=hdrs)
+                resp = conn.getresponse()
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            with self._lock:
+                self.sends += 1
+                if reused:
+                    self.reused += 1
+            return key, conn, resp, reused
+
+    def _finish(self, key, conn, resp) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+    def _send(self, method, url, body, headers, timeout):
+        for attempt in range(2):
+            key, conn, resp, reused = self._open(method, url, body, headers, timeout)
+            try:
+                raw = resp.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            self._finish(key, conn, resp)
+            with self._lock:
+                self.bytes_in += len(raw)
+            body_out = _decode_body(raw, resp.headers.get("Content-Encoding"))
+            return HTTPResponseData(resp.status, resp.headers, body_out)
+
+    def request(self, method: str, url: str, body: bytes | None = None, headers: dict | None = None,
+                timeout: float | None = None) -> HTTPResponseData:
+        timeout = self.timeout if timeout is None else timeout
+        t0 = time.perf_counter()
+        try:
+            for _ in range(self.max_redirects + 1):
+                resp = self._send(method, url, body, headers, timeout)
+                location = resp.headers.get("Location")
+                if resp.status in (301, 302, 303, 307, 308) and location:
+                    url = urljoin(url, location)
+                    if resp.status == 303:
+                        method, body = "GET", None
+                    continue
+                return resp
+            raise http.client.HTTPException(f"redirecionamentos demais: {url}")
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.requests += 1
+                self.total_latency += time.perf_counter() - t0
+
+    def open(self, method: str, url: str, headers: dict | None = None, timeout: float | None = None,
+             chunk_size: int = 64 * 1024) -> StreamingResponse:
+        """Como request(), mas devolve o corpo em streaming (use com `with`)."""
+        timeout = self.timeout if timeout is None else timeout
+        t0 = time.perf_counter()
+        try:
+            for _ in range(self.max_redirects + 1):
+                key, conn, resp, _reused = self._open(method, url, None, headers, timeout)
+                location = resp.headers.get("Location")
+                if resp.status in (301, 302, 303, 307, 308) and location:
+                    try:
+                        resp.read()
+                    except Exception:
+                        conn.close()
+                    else:
+                        self._finish(key, conn, resp)
+                    url = urljoin(url, location)
+                    if resp.status == 303:
+                        method = "GET"
+                    continue
+                return StreamingResponse(self, key, conn, resp, chunk_size)
+            raise http.client.HTTPException(f"redirecionamentos demais: {url}")
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.requests += 1
+                self.total_latency += time.perf_counter() - t0
+
+    def stats(self) -> dict:
+        with self._lock:
+            n = self.requests
+            return {
+                "requests": n,
+                "sends": self.sends,
+                "reused": self.reused,
+                "connections_opened": self.connections_opened,
+                "errors": self.errors,
+                "bytes_in": self.bytes_in,
+                "avg_latency_ms": (self.total_latency / n * 1000.0) if n else 0.0,
+                "idle": sum(len(v) for v in self._idle.values()),
+            }
+
+
+HTTP_POOL = HTTPPool()
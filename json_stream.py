@@ -0,0 +1,142 @@
+import json
+
+_WS = " \t\r\n"
+_DELIMS = _WS + ",]}"
+_NEED_MORE = object()
+
+
+class FeedStreamParser:
+    """
+    Parser incremental para o feed {"chave": valor, ..., "news": [ {...}, ... ]}.
+
+    feed(texto) recebe pedaços do documento conforme chegam e devolve os
+    eventos já completos:
+      ("field", chave, valor)  - campos de topo fora do array
+      ("item", obj)            - cada elemento do array `array_key`
+    Só o trecho ainda não consumido fica em memória, nunca a árvore inteira.
+    close() sinaliza o fim do documento e falha se ele estiver incompleto.
+    """
+
+    def __init__(self, array_key: str = "news"):
+        self.array_key = array_key
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._eof = False
+
+    def feed(self, text: str) -> list:
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += text
+        return list(self._parse())
+
+    def close(self) -> list:
+        self._eof = True
+        events = list(self._parse())
+        if self._state != "done":
+            raise ValueError("JSON incompleto")
+        return events
+
+    def _error(self, expected: str):
+        ch = self._buf[self._pos:self._pos + 1]
+        return ValueError(f"JSON inválido: esperado {expected}, veio {ch!r}")
+
+    def _skip_ws(self) -> bool:
+        buf, pos, n = self._buf, self._pos, len(self._buf)
+        while pos < n and buf[pos] in _WS:
+            pos += 1
+        self._pos = pos
+        return pos < n
+
+    def _value(self):
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as e:
+            if self._eof:
+                raise ValueError(f"JSON inválido: {e}") from None
+            return _NEED_MORE
+        # número/literal só termina num delimitador: "12.5e" ainda pode virar "12.5e3"
+        if not self._eof and self._buf[self._pos] not in '"{[':
+            if end == len(self._buf) or self._buf[end] not in _DELIMS:
+                return _NEED_MORE
+        self._pos = end
+        return value
+
+    def _parse(self):
+        while self._skip_ws():
+            c = self._buf[self._pos]
+            st = self._state
+
+            if st == "start":
+                if c != "{":
+                    raise self._error("'{'")
+                self._pos += 1
+                self._state = "key_or_end"
+
+            elif st == "key_or_end":
+                if c == "}":
+                    self._pos += 1
+                    self._state = "done"
+                else:
+                    self._state = "key"
+
+            elif st == "key":
+                if c != '"':
+                    raise self._error("chave")
+                key = self._value()
+                if key is _NEED_MORE:
+                    return
+                self._key = key
+                self._state = "colon"
+
+            elif st == "colon":
+                if c != ":":
+                    raise self._error("':'")
+                self._pos += 1
+                self._state = "value"
+
+            elif st == "value":
+                if self._key == self.array_key and c == "[":
+                    self._pos += 1
+                    self._state = "item_or_end"
+                    continue
+                value = self._value()
+                if value is _NEED_MORE:
+                    return
+                yield ("field", self._key, value)
+                self._state = "sep"
+
+            elif st in ("item_or_end", "item"):
+                if st == "item_or_end" and c == "]":
+                    self._pos += 1
+                    self._state = "sep"
+                    continue
+                value = self._value()
+                if value is _NEED_MORE:
+                    return
+                yield ("item", value)
+                self._state = "item_sep"
+
+            elif st == "item_sep":
+                if c == ",":
+                    self._state = "item"
+                elif c == "]":
+                    self._state = "sep"
+                else:
+                    raise self._error("',' ou ']'")
+                self._pos += 1
+
+            elif st == "sep":
+                if c == ",":
+                    self._state = "key"
+                elif c == "}":
+                    self._state = "done"
+                else:
+                    raise self._error("',' ou '}'")
+                self._pos += 1
+
+            else:  # done
+                raise self._error("fim do documento")
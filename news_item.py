@@ -0,0 +1,40 @@
+import hashlib
+import sys
+
+# chave de data empacotada num int (date_keys.pack_date_key): comparar ints
+# dá a mesma ordem que comparar (ano, mês, dia, período).
+# Sem data = NO_DATE, menor que qualquer data: numa ordenação decrescente
+# (estável) os itens sem data ficam no fim, na ordem original.
+NO_DATE = -1
+
+
+def content_id(date: str, title: str, category: str) -> str:
+    """Id de um item sem "id" explícito no feed: hash de data + título + categoria."""
+    h = hashlib.sha1(f"{date}\x1f{title}\x1f{category}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+class NewsItem:
+    """
+    Notícia normalizada. Com __slots__ não há __dict__ por registro; categoria
+    e data são internadas (poucos valores distintos, repetidos em milhares de
+    itens) e a data ordenável é um int (date_keys.parse_date_key).
+    """
+
+    __slots__ = ("id", "date", "title", "description", "category", "sort_key")
+
+    def __init__(self, id: str, date: str, title: str, description: str, category: str,
+                 sort_key: int = NO_DATE):
+        self.id = id
+        self.date = sys.intern(date)
+        self.title = title
+        self.description = description
+        self.category = sys.intern(category)
+        self.sort_key = sort_key
+
+    def same_content(self, other: "NewsItem") -> bool:
+        return (self.date == other.date and self.title == other.title
+                and self.description == other.description and self.category == other.category)
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.id!r}, {self.date!r}, {self.title!r}, {self.category!r})"
@@ -0,0 +1,201 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+ROW_CACHE_MAX_BYTES = 4 * 1024 * 1024
+SCROLL_SMOOTHING = 18.0  # 1/s: fração do caminho até o alvo percorrida por segundo (easing exponencial)
+
+
+class VirtualList:
+    """
+    Lista virtualizada de altura fixa por linha.
+
+    Só as linhas que aparecem no painel são desenhadas, cada uma a partir de
+    uma Surface em cache (chave = conteúdo + estado). A rolagem é em pixels,
+    com easing até o alvo; o thumb da barra pode ser arrastado e clicar na
+    trilha pagina. Posição -> linha é aritmética, então o custo por frame
+    não depende do tamanho da lista.
+
+    `render_row(surface, rect, item, selected, hovered)` desenha uma linha
+    em `rect` (coordenadas locais da Surface da linha).
+    """
+
+    def __init__(self, panel: pygame.Rect, scrollbar: pygame.Rect, row_h: int, row_gap: int,
+                 pad: int, inset_left: int, inset_right: int, min_thumb: int, thumb_inset: int, thumb_w: int, border: int,
+                 render_row, cache_bytes: int = ROW_CACHE_MAX_BYTES):
+        self.panel = panel
+        self.scrollbar = scrollbar
+        self.row_h = row_h
+        self.pitch = row_h + row_gap
+        self.row_gap = row_gap
+        self.pad = pad
+        self.min_thumb = min_thumb
+        self.thumb_inset = thumb_inset
+        self.thumb_w = thumb_w
+        self.border = border
+        self.render_row = render_row
+        # área das linhas (sem o padding vertical e sem a barra)
+        self.rows_rect = pygame.Rect(panel.left + inset_left, panel.top + pad,
+                                     panel.width - inset_left - inset_right, panel.height - 2 * pad)
+
+        self.scroll = 0.0   # deslocamento atual (px)
+        self.target = 0.0   # para onde o easing está indo
+        self.dragging = False
+        self._grab_dy = 0
+
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self.cache_max_bytes = cache_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # -------- geometria --------
+    @property
+    def page_rows(self) -> int:
+        """Quantas linhas inteiras cabem no painel."""
+        return max(1, (self.rows_rect.height + self.row_gap) // self.pitch)
+
+    @property
+    def scroll_px(self) -> int:
+        return int(round(self.scroll))
+
+    def max_scroll(self, count: int) -> int:
+        return max(0, count * self.pitch - self.row_gap - self.rows_rect.height)
+
+    def _clamp(self, v: float, count: int) -> float:
+        return max(0.0, min(float(v), float(self.max_scroll(count))))
+
+    def visible_range(self, count: int) -> range:
+        scroll = self.scroll_px
+        first = scroll // self.pitch
+        last = min(count, math.ceil((scroll + self.rows_rect.height) / self.pitch))
+        return range(first, max(first, last))
+
+    def row_at(self, pos, count: int):
+        """Índice da linha sob `pos` (None fora das linhas ou no vão entre elas)."""
+        x, y = pos
+        r = self.rows_rect
+        if not (r.left <= x < r.right and r.top <= y < r.bottom):
+            return None
+        offset = y - r.top + self.scroll_px
+        idx, within = divmod(offset, self.pitch)
+        if within >= self.row_h or idx >= count:
+            return None
+        return int(idx)
+
+    def thumb_rect(self, count: int) -> pygame.Rect:
+        track = self.scrollbar
+        content = max(1, count * self.pitch - self.row_gap)
+        h = max(self.min_thumb, min(track.height, int(track.height * self.rows_rect.height / content)))
+        ms = self.max_scroll(count)
+        t = 0.0 if ms == 0 else self.scroll / ms
+        y = track.top + int((track.height - h) * t)
+        return pygame.Rect(track.left + self.thumb_inset, y, self.thumb_w, h)
+
+    # -------- rolagem --------
+    def reset(self) -> None:
+        self.scroll = self.target = 0.0
+        self.dragging = False
+
+    def clamp(self, count: int) -> None:
+        self.scroll = self._clamp(self.scroll, count)
+        self.target = self._clamp(self.target, count)
+
+    def scroll_by(self, dy: float, count: int) -> None:
+        self.target = self._clamp(self.target + dy, count)
+
+    def scroll_rows(self, rows: float, count: int) -> None:
+        self.scroll_by(rows * self.pitch, count)
+
+    def ensure_visible(self, idx: int, count: int) -> None:
+        top = idx * self.pitch
+        bottom = top + self.row_h
+        view_h = self.rows_rect.height
+        if top < self.target:
+            self.target = float(top)
+        elif bottom > self.target + view_h:
+            self.target = float(bottom - view_h)
+        self.target = self._clamp(self.target, count)
+
+    def update(self, dt: float) -> None:
+        """Avança o easing; chame uma vez por frame."""
+        if self.dragging or self.scroll == self.target:
+            return
+        self.scroll += (self.target - self.scroll) * min(1.0, dt * SCROLL_SMOOTHING)
+        if abs(self.target - self.scroll) < 0.5:
+            self.scroll = self.target
+
+    # -------- arrastar o thumb --------
+    def press(self, pos, count: int) -> bool:
+        """Clique na barra: pega o thumb ou pagina. True se o clique foi da barra."""
+        if not self.scrollbar.collidepoint(pos):
+            return False
+        thumb = self.thumb_rect(count)
+        if thumb.collidepoint(pos):
+            self.dragging = True
+            self._grab_dy = pos[1] - thumb.top
+        else:
+            page = self.rows_rect.height - self.pitch
+            self.scroll_by(page if pos[1] > thumb.bottom else -page, count)
+        return True
+
+    def drag(self, pos, count: int) -> None:
+        if not self.dragging:
+            return
+        track = self.scrollbar
+        thumb_h = self.thumb_rect(count).height
+        span = track.height - thumb_h
+        t = 0.0 if span <= 0 else (pos[1] - self._grab_dy - track.top) / span
+        self.scroll = self.target = self._clamp(t * self.max_scroll(count), count)
+
+    def release(self) -> None:
+        self.dragging = False
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "bytes": self._cache_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+    # -------- desenho --------
+    def _row_surface(self, item, selected: bool, hovered: bool) -> pygame.Surface:
+        size = (self.rows_rect.width, self.row_h)
+        key = (item.id, item.date, item.title, selected, hovered, size)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = pygame.Surface(size).convert()
+        self.render_row(surf, surf.get_rect(), item, selected, hovered)
+        nbytes = size[0] * size[1] * surf.get_bytesize()
+        self._cache[key] = surf
+        self._cache_bytes += nbytes
+        while self._cache_bytes > self.cache_max_bytes and len(self._cache) > 1:
+            _, old = self._cache.popitem(last=False)
+            self._cache_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return surf
+
+    def draw(self, surface: pygame.Surface, items, selected: int, hovered) -> None:
+        count = len(items)
+        r = self.rows_rect
+        prev_clip = surface.get_clip()
+        surface.set_clip(r.clip(prev_clip))
+        scroll = self.scroll_px
+        for idx in self.visible_range(count):
+            y = r.top + idx * self.pitch - scroll
+            surface.blit(self._row_surface(items[idx], idx == selected, idx == hovered), (r.left, y))
+        surface.set_clip(prev_clip)
+
+        # barra de rolagem
+        pygame.draw.rect(surface, (40, 40, 40), self.scrollbar)
+        pygame.draw.rect(surface, (120, 120, 120), self.scrollbar, self.border)
+        thumb = self.thumb_rect(count)
+        pygame.draw.rect(surface, (200, 200, 200) if self.dragging else (180, 180, 180), thumb)
+        pygame.draw.rect(surface, (0, 0, 0), thumb, self.border)
@@ -0,0 +1,486 @@
+import base64
+import re
+import unicodedata
+from array import array
+from itertools import accumulate, chain
+from operator import sub
+
+from news_item import NewsItem
+
+# -----------------------------
+# Filtering + sorting
+# -----------------------------
+def _sort_key(n: NewsItem) -> int:
+    return n.sort_key
+
+def sort_news(news):
+    """
+    Ordem mestre: datas parseadas (mais recente primeiro) e depois as sem
+    data (NO_DATE é o menor int), na ordem original: o sort é estável.
+    """
+    return sorted(news, key=_sort_key, reverse=True)
+
+def index_by_category(news, categories=()):
+    """
+    Índice categoria -> itens, já na ordem mestre de `news`.
+    Categorias sem itens também ganham lista vazia.
+    """
+    by_cat = {c: [] for c in categories}
+    for n in news:
+        by_cat.setdefault(n.category, []).append(n)
+    return by_cat
+
+# -----------------------------
+# Identidade estável + merge incremental
+# -----------------------------
+class NewsDelta:
+    """Diferença (por _id) entre o store atual e um feed novo."""
+
+    def __init__(self, inserted=(), updated=(), deleted=()):
+        self.inserted = list(inserted)   # registros novos
+        self.updated = list(updated)     # pares (antigo, novo)
+        self.deleted = list(deleted)     # registros antigos
+        self.base = None                 # store sobre o qual o delta foi aplicado
+        self.categories = {n.category for n in self.inserted} | {n.category for n in self.deleted}
+        for old, new in self.updated:
+            self.categories.add(old.category)
+            self.categories.add(new.category)
+
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+    def __repr__(self) -> str:
+        return f"+{len(self.inserted)} ~{len(self.updated)} -{len(self.deleted)}"
+
+
+def diff_news(old_by_id: dict, items) -> NewsDelta:
+    """`old_by_id`: id -> registro atual; `items`: registros normalizados do feed novo."""
+    inserted, updated = [], []
+    seen = set()
+    for n in items:
+        i = n.id
+        seen.add(i)
+        o = old_by_id.get(i)
+        if o is None:
+            inserted.append(n)
+        elif o is not n and not o.same_content(n):
+            updated.append((o, n))
+    deleted = [o for i, o in old_by_id.items() if i not in seen]
+    return NewsDelta(inserted, updated, deleted)
+
+def feed_positions(items) -> dict:
+    """id -> posição no feed (`items` na ordem em que vieram): desempate de sort_news."""
+    return {n.id: i for i, n in enumerate(items)}
+
+def _master_key(feed_pos: dict):
+    # mesma ordem de sort_news sobre o feed: data decrescente e, na mesma
+    # data, a ordem do feed (é o que o sort estável faz no rebuild)
+    return lambda n: (-n.sort_key, feed_pos[n.id])
+
+def in_feed_order(news, feed_pos: dict) -> bool:
+    """True se `news` (já por data) está na ordem mestre do feed de `feed_pos`."""
+    for a, b in zip(news, news[1:]):
+        if a.sort_key == b.sort_key and feed_pos[a.id] > feed_pos[b.id]:
+            return False
+    return True
+
+def merge_news(news, by_category, search, delta: NewsDelta, feed_pos: dict):
+    """
+    Aplica `delta` sobre (ordem mestre, índice por categoria, SearchIndex) e
+    devolve versões novas dos três, na mesma ordem que um rebuild do feed
+    daria (`feed_pos` de feed_positions desempata datas iguais). Nada do
+    store antigo é modificado: só as categorias tocadas (ou reordenadas pelo
+    feed, que entram em `delta.categories`) ganham lista nova e o
+    SearchIndex só reindexa os itens que entraram/saíram.
+    """
+    key = _master_key(feed_pos)
+    repl = {id(o): n for o, n in delta.updated}
+    gone = {id(o) for o in delta.deleted}
+
+    # a lista já está quase em ordem: o timsort só intercala os novos
+    out = [repl.get(id(n), n) for n in news if id(n) not in gone]
+    out.extend(delta.inserted)
+    out.sort(key=key)
+
+    by_cat = dict(by_category)
+    for c, lst in by_category.items():
+        if c not in delta.categories and not in_feed_order(lst, feed_pos):
+            delta.categories.add(c)
+    fresh = {c: [] for c in delta.categories}
+    for n in out:
+        lst = fresh.get(n.category)
+        if lst is not None:
+            lst.append(n)
+    by_cat.update(fresh)
+
+    removed = delta.deleted + [o for o, _ in delta.updated]
+    added = delta.inserted + [n for _, n in delta.updated]
+    return out, by_cat, search.updated(removed, added, out)
+
+# -----------------------------
+# Search index (substring sem acento, case-insensitive, plural = singular)
+# -----------------------------
+class _FoldTable(dict):
+    # codepoint -> o mesmo caractere sem acento; preenchida sob demanda pelo str.translate
+    def __missing__(self, cp):
+        folded = "".join(c for c in unicodedata.normalize("NFKD", chr(cp)) if not unicodedata.combining(c))
+        self[cp] = folded
+        return folded
+
+_FOLD = _FoldTable()
+
+def fold_text(s: str) -> str:
+    """casefold + remove acentos ("Competições" -> "competicoes")."""
+    return str(s).casefold().translate(_FOLD)
+
+# plurais comuns em PT: "competições" e "competição" viram o mesmo termo
+_PLURAL_RULES = (("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el"), ("ns", "m"))
+_PLURAL_RE = re.compile(r"\w+s\b")  # todas as regras terminam em "s"
+
+def stem_token(tok: str) -> str:
+    for suffix, repl in _PLURAL_RULES:
+        if tok.endswith(suffix) and len(tok) > len(suffix) + 1:
+            return tok[:-len(suffix)] + repl
+    if tok.endswith("s") and len(tok) > 3:
+        return tok[:-1]
+    return tok
+
+class _StemTable(dict):
+    # palavra dobrada -> singular (stem_token), memoizado
+    def __missing__(self, tok):
+        stem = self[tok] = stem_token(tok)
+        return stem
+
+_STEMS = _StemTable()
+
+def stem_text(folded: str) -> str:
+    """Texto já dobrado com cada palavra no singular ("competicoes nacionais" -> "competicao nacional")."""
+    return _PLURAL_RE.sub(lambda m: _STEMS[m.group()], folded)
+
+def _trigrams(*texts) -> set:
+    grams = set()
+    for t in texts:
+        grams.update(t[i:i + 3] for i in range(len(t) - 2))
+    return grams
+
+_WORD_RE = re.compile(r"\w+")
+
+def _slot_grams(t: str, d: str) -> set:
+    # trigramas do título/descrição dobrados + os de dentro das palavras que
+    # mudam no singular (a busca no singular só usa trigramas de dentro de palavra)
+    return _trigrams(t, d, *map(_STEMS.__getitem__, _PLURAL_RE.findall(t + " " + d)))
+
+def _pack(post) -> str:
+    # postings (ordenadas) no snapshot: diferenças entre vizinhos, que comprimem
+    # bem, em bytes de array (ordem de bytes da máquina: o snapshot é local)
+    gaps = array("i", map(sub, post, chain((0,), post)))
+    return base64.b64encode(gaps.tobytes()).decode("ascii")
+
+def _unpack(text: str):
+    gaps = array("i")
+    gaps.frombytes(base64.b64decode(text))
+    return array("i", accumulate(gaps))
+
+def _posting(post: dict, gram: str):
+    # postings vindas do snapshot ficam empacotadas até o primeiro uso
+    p = post.get(gram, ())
+    if isinstance(p, str):
+        p = post[gram] = _unpack(p)
+    return p
+
+
+_STATE_VERSION = 2  # 2: trigramas também das palavras no singular
+
+class SearchIndex:
+    """
+    Índice de trigramas dos itens de `news` para o filtro.
+
+    Casa como o filtro original (`texto in título or texto in descrição`),
+    só que sem diferenciar maiúsculas nem acentos e sem diferenciar plural
+    de singular: título e descrição ficam guardados dobrados (fold_text) e
+    também com as palavras no singular (stem_text); a busca casa se ela
+    dobrada está no texto dobrado ou se ela no singular está no texto no
+    singular ("competicao" acha "Competições"). Cada trigrama do texto
+    dobrado e das palavras no singular aponta para os slots que o contêm.
+    query() intersecta as postings dos trigramas da busca (da forma no
+    singular, só os de dentro de palavra) para achar candidatos e confirma
+    cada um com `in` (sem trigramas, confirma todos). Se a
+    busca nova contém a anterior (digitou mais, nas duas formas), só o
+    resultado anterior é confirmado: o resultado só encolhe.
+    Resultado: primeiro quem casa no título, depois quem casa só na
+    descrição, cada grupo na ordem mestre.
+
+    As postings guardam "slots" estáveis por registro; query() devolve
+    posições na ordem mestre (rank do slot). updated() gera um índice novo
+    aplicando só remoções/inserções e compartilha o resto com o atual.
+    """
+
+    def __init__(self, news=None):
+        self.size = 0
+        self._post = {}        # trigrama -> array de slots
+        self._items = []       # slot -> registro (None = slot livre)
+        self._titles = []      # slot -> título dobrado
+        self._descs = []       # slot -> descrição dobrada
+        self._stem_titles = []  # slot -> título dobrado, no singular
+        self._stem_descs = []   # slot -> descrição dobrada, no singular
+        self._free = []
+        self._slot_of = None   # id(registro) -> slot, montado sob demanda
+        self._rank = None      # slot -> posição; None = slot é a posição
+        self._reset_query()
+        if news is not None:
+            self._build(news)
+
+    def _fold_items(self, news):
+        self._items = list(news)
+        self._titles = [fold_text(n.title) for n in self._items]
+        self._descs = [fold_text(n.description) for n in self._items]
+        self._stem_titles = [stem_text(t) for t in self._titles]
+        self._stem_descs = [stem_text(d) for d in self._descs]
+
+    def _build(self, news):
+        self._fold_items(news)
+        self.size = len(self._items)
+        post = {}
+        for s, (t, d) in enumerate(zip(self._titles, self._descs)):
+            for g in _slot_grams(t, d):
+                p = post.get(g)
+                if p is None:
+                    post[g] = p = array("i")
+                p.append(s)
+        self._post = post
+
+    def _slots(self) -> dict:
+        if self._slot_of is None:
+            self._slot_of = {id(n): s for s, n in enumerate(self._items) if n is not None}
+        return self._slot_of
+
+    def to_state(self) -> dict:
+        """Estado serializável para o snapshot em disco, já em posições."""
+        def packed(p):
+            if self._rank is None:  # slot é a posição e as postings já estão em ordem
+                return p if isinstance(p, str) else _pack(p)
+            if isinstance(p, str):
+                p = _unpack(p)
+            return _pack(sorted(self._rank[s] for s in p))
+        return {
+            "version": _STATE_VERSION,
+            "size": self.size,
+            "grams": list(self._post),
+            "post": [packed(p) for p in self._post.values()],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, news=None) -> "SearchIndex":
+        """
+        Reconstrói sem recalcular os trigramas (inverso de to_state); `news`
+        na ordem mestre. Cada posting só é desempacotada quando usada.
+        """
+        if state.get("version") != _STATE_VERSION:
+            return cls(news or [])  # snapshot de um formato anterior do índice: monta de novo
+        idx = cls()
+        idx.size = state["size"]
+        idx._fold_items(news or [])
+        idx._post = dict(zip(state["grams"], state["post"]))
+        return idx
+
+    def updated(self, removed, added, news) -> "SearchIndex":
+        """
+        Novo índice com `removed` saindo e `added` entrando; `news` é a nova
+        ordem mestre. Só as postings dos trigramas tocados são copiadas: este
+        índice continua válido para quem ainda o está usando.
+        """
+        idx = SearchIndex()
+        slot_of = dict(self._slots())
+        items = list(self._items)
+        titles = list(self._titles)
+        descs = list(self._descs)
+        stem_titles = list(self._stem_titles)
+        stem_descs = list(self._stem_descs)
+        free = list(self._free)
+        post = dict(self._post)
+        touched = set()
+
+        def own(term):
+            if term not in touched:
+                touched.add(term)
+                post[term] = array("i", _posting(post, term))
+            return post[term]
+
+        for n in removed:
+            s = slot_of.pop(id(n))
+            for g in _slot_grams(titles[s], descs[s]):
+                own(g).remove(s)
+            items[s] = titles[s] = descs[s] = stem_titles[s] = stem_descs[s] = None
+            free.append(s)
+
+        for n in added:
+            t, d = fold_text(n.title), fold_text(n.description)
+            st, sd = stem_text(t), stem_text(d)
+            if free:
+                s = free.pop()
+                items[s], titles[s], descs[s], stem_titles[s], stem_descs[s] = n, t, d, st, sd
+            else:
+                s = len(items)
+                items.append(n)
+                titles.append(t)
+                descs.append(d)
+                stem_titles.append(st)
+                stem_descs.append(sd)
+            slot_of[id(n)] = s
+            for g in _slot_grams(t, d):
+                own(g).append(s)
+
+        for g in touched:
+            if not post[g]:
+                del post[g]
+
+        rank = [0] * len(items)
+        for i, n in enumerate(news):
+            rank[slot_of[id(n)]] = i
+        idx.size = len(news)
+        idx._post = post
+        idx._items, idx._titles, idx._descs = items, titles, descs
+        idx._stem_titles, idx._stem_descs = stem_titles, stem_descs
+        idx._free, idx._slot_of, idx._rank = free, slot_of, rank
+        return idx
+
+    def _reset_query(self):
+        self._last_query = None
+        self._last_stem = None
+        self._last_ids = []
+        self._last_match = None
+
+    def _candidates(self, grams):
+        """Slots que podem conter todos os `grams`: interseção das postings."""
+        if not grams:
+            return [s for s, n in enumerate(self._items) if n is not None]
+        post = self._post
+        lists = sorted((_posting(post, g) for g in grams), key=len)
+        cand = set(lists[0])
+        for p in lists[1:]:
+            if len(cand) <= 32:
+                break  # poucos: a confirmação com `in` sai mais barata que intersectar
+            cand.intersection_update(p)
+        return cand
+
+    def query(self, text: str) -> list[int]:
+        q = fold_text((text or "").strip())
+        if q == self._last_query:
+            return self._last_ids
+        if not q:
+            ids = list(range(self.size))
+            self._last_query, self._last_ids, self._last_match = q, ids, None
+            return ids
+
+        sq = stem_text(q)
+        prev = self._last_query
+        if self._last_match is not None and prev and prev in q and self._last_stem in sq:
+            cand = self._last_match  # estende a busca anterior: só encolhe
+        elif sq == q:
+            cand = self._candidates(_trigrams(q))
+        else:
+            cand = set(self._candidates(_trigrams(q))).union(self._candidates(_trigrams(*_WORD_RE.findall(sq))))
+        titles, descs = self._titles, self._descs
+        stem_titles, stem_descs = self._stem_titles, self._stem_descs
+        in_title = {s for s in cand if q in titles[s] or sq in stem_titles[s]}
+        match = in_title | {s for s in cand if s not in in_title and (q in descs[s] or sq in stem_descs[s])}
+
+        rank = self._rank
+        ordered = sorted(match) if rank is None else sorted(match, key=rank.__getitem__)
+        ranked = [i for i in ordered if i in in_title] + [i for i in ordered if i not in in_title]
+        if rank is not None:
+            ranked = [rank[s] for s in ranked]
+
+        self._last_query, self._last_stem = q, sq
+        self._last_ids, self._last_match = ranked, match
+        return ranked
+
+
+def build_view(news_all, active_category, filter_text, by_category=None, search=None):
+    """
+    Se `by_category`/`search` vierem (de normalize_data), `news_all` já está
+    na ordem mestre e a troca de aba vira um lookup. Sem eles, ordena e
+    indexa na hora. As listas retornadas podem ser as do índice: não modifique.
+    """
+    ft = (filter_text or "").strip()
+
+    if by_category is None:
+        news_all = sort_news(news_all)
+        by_category = index_by_category(news_all)
+        search = None
+
+    if not ft:
+        if active_category == "Todas":
+            return news_all
+        return by_category.get(active_category, [])
+
+    if search is None:
+        search = SearchIndex(news_all)
+    items = [news_all[i] for i in search.query(ft)]
+    if active_category != "Todas":
+        items = [n for n in items if n.category == active_category]
+    return items
+
+
+class NewsView:
+    """
+    View memoizada das notícias.
+
+    O resultado de build_view é guardado com a chave
+    (stamp dos dados, categoria, filtro) e só é recalculado
+    quando um desses muda. Hover, render e o bloco de segurança do loop
+    principal podem chamar get() quantas vezes quiserem por frame.
+    """
+
+    def __init__(self, news_all=None, by_category=None, search=None):
+        self.news_all = []
+        self.by_category = {}
+        self.search = None
+        self.version = 0
+        self._reset_version = 0
+        self._cat_version = {}
+        self._key = None
+        self._items = []
+        self.hits = 0
+        self.misses = 0
+        self.set_data(news_all or [], by_category, search)
+
+    def set_data(self, news_all, by_category=None, search=None) -> None:
+        if by_category is None:
+            news_all = sort_news(news_all)
+            by_category = index_by_category(news_all)
+            search = None
+        self.news_all = news_all
+        self.by_category = by_category
+        self.search = search or SearchIndex(news_all)
+        self.version += 1
+        self._reset_version = self.version
+
+    def apply_delta(self, news_all, by_category, search, delta) -> None:
+        """
+        Troca os dados por uma versão vinda de merge_news: só "Todas", buscas
+        e as categorias em `delta.categories` são invalidadas; as outras abas
+        continuam com a view memoizada (e a mesma lista do índice).
+        """
+        self.news_all = news_all
+        self.by_category = by_category
+        self.search = search
+        self.version += 1
+        for c in delta.categories:
+            self._cat_version[c] = self.version
+
+    def stamp(self, active_category, filter_text) -> int:
+        """Versão dos dados que a view (categoria, filtro) enxerga."""
+        if active_category == "Todas" or (filter_text or "").strip():
+            return self.version
+        return max(self._reset_version, self._cat_version.get(active_category, 0))
+
+    def get(self, active_category, filter_text):
+        key = (self.stamp(active_category, filter_text), active_category, (filter_text or "").strip())
+        if key == self._key:
+            self.hits += 1
+            return self._items
+        self.misses += 1
+        self._items = build_view(self.news_all, active_category, filter_text, self.by_category, self.search)
+        self._key = key
+        return self._items
@@ -0,0 +1,125 @@
+from bisect import bisect_left, insort
+from datetime import date
+
+
+def parse_round_date(value):
+    """"2026-03-29" -> date; None se ausente ou inválida."""
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+class ScheduleIndex:
+    """
+    Índice da tabela de uma competição, montado uma vez no carregamento:
+      - rodada -> registro da rodada (dict do JSON)
+      - datas ordenadas (bisect) -> rodada "atual" para uma data
+      - time (id ou nome) -> lista de jogos (rodada, partida), em ordem de rodada
+    Todas as consultas usadas por frame são O(1) ou O(log n).
+    """
+
+    def __init__(self, schedule=(), teams=()):
+        self._by_round = {}
+        self._rounds = []        # números de rodada, ordenados
+        self._dates = []         # (data, rodada) ordenados
+        self._fixtures = {}      # id do time -> [(rodada, partida), ...]
+        self._team_ids = {}      # nome -> id
+        for t in teams:
+            tid = t.get("id")
+            if tid:
+                self._team_ids[t.get("name", tid)] = tid
+                self._team_ids[tid] = tid
+        for rec in schedule:
+            self.add_round(rec)
+
+    def __len__(self) -> int:
+        return len(self._rounds)
+
+    def team_id(self, team: str) -> str:
+        """Id do time (aceita id ou nome); nomes sem id em `teams` viram a própria chave."""
+        return self._team_ids.get(team, team)
+
+    def add_round(self, rec: dict) -> None:
+        """Insere (ou substitui) uma rodada mantendo as estruturas ordenadas."""
+        num = rec.get("round")
+        if not isinstance(num, int):
+            return
+        if num in self._by_round:
+            self._remove_round(num)
+        self._by_round[num] = rec
+        if not self._rounds or self._rounds[-1] < num:
+            self._rounds.append(num)
+        else:
+            insort(self._rounds, num)
+
+        d = parse_round_date(rec.get("date"))
+        if d is not None:
+            # mesma data: desempata pelo número da rodada
+            key = (d, num)
+            if not self._dates or self._dates[-1] < key:
+                self._dates.append(key)
+            else:
+                insort(self._dates, key)
+
+        fixtures, team_ids = self._fixtures, self._team_ids
+        for m in rec.get("matches", []):
+            entry = (num, m)
+            for team in (m.get("home"), m.get("away")):
+                if not team:
+                    continue
+                tid = team_ids.get(team, team)
+                fx = fixtures.get(tid)
+                if fx is None:
+                    fixtures[tid] = [entry]
+                elif fx[-1][0] <= num:
+                    fx.append(entry)  # rodadas chegando em ordem (gerador, JSON)
+                else:
+                    insort(fx, entry, key=lambda f: f[0])
+
+    def _remove_round(self, num: int) -> None:
+        rec = self._by_round.pop(num)
+        del self._rounds[bisect_left(self._rounds, num)]
+        d = parse_round_date(rec.get("date"))
+        if d is not None:
+            i = bisect_left(self._dates, (d, num))
+            if i < len(self._dates) and self._dates[i] == (d, num):
+                del self._dates[i]
+        for m in rec.get("matches", []):
+            for side in ("home", "away"):
+                fx = self._fixtures.get(self.team_id(m.get(side)))
+                if fx:
+                    fx[:] = [f for f in fx if f[0] != num]
+
+    # -------- consultas --------
+    @property
+    def rounds(self) -> list:
+        return self._rounds
+
+    @property
+    def first_round(self):
+        return self._rounds[0] if self._rounds else None
+
+    @property
+    def last_round(self):
+        return self._rounds[-1] if self._rounds else None
+
+    def round(self, num: int):
+        return self._by_round.get(num)
+
+    def current_round(self, today: date):
+        """
+        Primeira rodada com data >= `today` (a próxima a ser jogada, ou a de
+        hoje). Depois da última data fica na última rodada; sem datas, na primeira.
+        """
+        if not self._dates:
+            return self.first_round
+        # (today,) fica antes de qualquer (today, rodada)
+        i = bisect_left(self._dates, (today,))
+        if i >= len(self._dates):
+            return self._dates[-1][1]
+        return self._dates[i][1]
+
+    def fixtures(self, team: str) -> list:
+        """Jogos do time (id ou nome) como [(rodada, partida), ...] em ordem de rodada."""
+        return self._fixtures.get(self.team_id(team), [])
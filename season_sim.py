@@ -0,0 +1,230 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+try:
+    import numpy as np
+except ImportError:  # opcional: sem numpy a simulação roda em Python puro (bem mais lenta)
+    np = None
+
+from standings import COL_GA, COL_GF, COL_PTS
+
+SIM_RUNS = 100_000
+SIM_SEED = 2026
+CHUNK_RUNS = 10_000    # temporadas por tarefa do pool (fixo: o resultado não depende do nº de workers)
+BATCH_RUNS = 2_000     # temporadas amostradas de uma vez dentro da tarefa (limita a memória)
+HOME_ADV = 1.10        # multiplicador de gols do mandante (e divisor do visitante)
+PRIOR_GAMES = 5        # jogos "médios" somados a cada time antes de estimar força
+DEFAULT_GOALS = 1.35   # média de gols por time/jogo sem nenhum resultado
+TOP_SPOTS = 4
+RELEGATION_SPOTS = 4
+
+
+# -----------------------------
+# Modelo (Poisson com força de ataque/defesa)
+# -----------------------------
+def match_rates(standings) -> tuple:
+    """
+    Jogos restantes de `standings` e as médias de gols (casa, fora) de cada um.
+    Força = gols pró/contra por jogo, encolhidos para a média da liga
+    (PRIOR_GAMES), relativos a essa média.
+    -> (casa, fora, lambda_casa, lambda_fora) em listas paralelas.
+    """
+    stats = [[int(v) for v in row] for row in standings.stats]
+    played = [int(standings.hg[k]) >= 0 for k in range(len(standings.hg))]
+    games = [0] * len(stats)
+    for k, ok in enumerate(played):
+        if ok:
+            games[int(standings.home[k])] += 1
+            games[int(standings.away[k])] += 1
+
+    total_gf = sum(row[COL_GF] for row in stats)
+    total_games = sum(games)
+    mu = total_gf / total_games if total_games else DEFAULT_GOALS
+
+    att = [(row[COL_GF] + PRIOR_GAMES * mu) / (g + PRIOR_GAMES) / mu for row, g in zip(stats, games)]
+    dfn = [(row[COL_GA] + PRIOR_GAMES * mu) / (g + PRIOR_GAMES) / mu for row, g in zip(stats, games)]
+
+    home, away, lam_h, lam_a = [], [], [], []
+    for k, ok in enumerate(played):
+        if ok:
+            continue
+        h, a = int(standings.home[k]), int(standings.away[k])
+        home.append(h)
+        away.append(a)
+        lam_h.append(mu * att[h] * dfn[a] * HOME_ADV)
+        lam_a.append(mu * att[a] * dfn[h] / HOME_ADV)
+    return home, away, lam_h, lam_a
+
+
+# -----------------------------
+# Tarefas (rodam nos processos do pool; só recebem tipos simples)
+# -----------------------------
+def _simulate_chunk_numpy(task: dict):
+    T = task["teams"]
+    home = np.asarray(task["home"], dtype=np.int64)
+    away = np.asarray(task["away"], dtype=np.int64)
+    lam_h = np.asarray(task["lam_h"], dtype=np.float64)
+    lam_a = np.asarray(task["lam_a"], dtype=np.float64)
+    base_pts = np.asarray(task["pts"], dtype=np.int64)
+    base_gd = np.asarray(task["gd"], dtype=np.int64)
+    base_gf = np.asarray(task["gf"], dtype=np.int64)
+    win, draw, loss = task["points"]
+    top_n, rel_n = task["top_n"], task["rel_n"]
+
+    # incidência partida -> time: pontos/gols por time = (B, M) @ (M, T)
+    M = len(home)
+    H = np.zeros((M, T))
+    A = np.zeros((M, T))
+    H[np.arange(M), home] = 1.0
+    A[np.arange(M), away] = 1.0
+
+    rng = np.random.Generator(np.random.PCG64(np.random.SeedSequence(task["entropy"], spawn_key=(task["chunk"],))))
+    title = np.zeros(T, dtype=np.int64)
+    top = np.zeros(T, dtype=np.int64)
+    rel = np.zeros(T, dtype=np.int64)
+
+    left = task["runs"]
+    while left > 0:
+        B = min(BATCH_RUNS, left)
+        left -= B
+        gh = rng.poisson(lam_h, size=(B, M))
+        ga = rng.poisson(lam_a, size=(B, M))
+        ph = np.where(gh > ga, win, np.where(gh == ga, draw, loss))
+        pa = np.where(ga > gh, win, np.where(gh == ga, draw, loss))
+
+        pts = base_pts + np.rint(ph @ H + pa @ A).astype(np.int64)
+        gf = np.rint(gh @ H + ga @ A).astype(np.int64)
+        gd = base_gd + gf - np.rint(ga @ H + gh @ A).astype(np.int64)
+        gf += base_gf
+
+        # pontos, saldo, gols pró e, empatado em tudo, sorteio (a ordem original
+        # de Standings.order favoreceria sempre os primeiros da lista)
+        order = np.lexsort((rng.random(pts.shape), -gf, -gd, -pts), axis=-1)
+        title += np.bincount(order[:, 0], minlength=T)
+        top += np.bincount(order[:, :top_n].ravel(), minlength=T)
+        if rel_n:
+            rel += np.bincount(order[:, T - rel_n:].ravel(), minlength=T)
+    return title.tolist(), top.tolist(), rel.tolist()
+
+
+def _poisson(rnd: random.Random, lam: float) -> int:
+    # Knuth: suficiente para médias de gols (lam pequeno)
+    limit, k, p = math.exp(-lam), 0, rnd.random()
+    while p > limit:
+        k += 1
+        p *= rnd.random()
+    return k
+
+
+def _simulate_chunk_python(task: dict):
+    T = task["teams"]
+    win, draw, loss = task["points"]
+    top_n, rel_n = task["top_n"], task["rel_n"]
+    rnd = random.Random(f"{task['entropy']}:{task['chunk']}")
+    fixtures = list(zip(task["home"], task["away"], task["lam_h"], task["lam_a"]))
+    title, top, rel = [0] * T, [0] * T, [0] * T
+
+    for _ in range(task["runs"]):
+        pts, gd, gf = list(task["pts"]), list(task["gd"]), list(task["gf"])
+        for h, a, lh, la in fixtures:
+            g1, g2 = _poisson(rnd, lh), _poisson(rnd, la)
+            gf[h] += g1
+            gf[a] += g2
+            gd[h] += g1 - g2
+            gd[a] += g2 - g1
+            if g1 > g2:
+                pts[h] += win
+                pts[a] += loss
+            elif g1 == g2:
+                pts[h] += draw
+                pts[a] += draw
+            else:
+                pts[h] += loss
+                pts[a] += win
+        lots = [rnd.random() for _ in range(T)]
+        order = sorted(range(T), key=lambda t: (-pts[t], -gd[t], -gf[t], lots[t]))
+        title[order[0]] += 1
+        for t in order[:top_n]:
+            top[t] += 1
+        for t in order[T - rel_n:] if rel_n else ():
+            rel[t] += 1
+    return title, top, rel
+
+
+def _simulate_chunk(task: dict):
+    if task["vectorized"]:
+        return _simulate_chunk_numpy(task)
+    return _simulate_chunk_python(task)
+
+
+# -----------------------------
+# API
+# -----------------------------
+def simulate_season(standings, runs: int = SIM_RUNS, seed: int = SIM_SEED,
+                    top_n: int = TOP_SPOTS, relegation: int = RELEGATION_SPOTS,
+                    workers: int | None = None) -> dict:
+    """
+    Joga N vezes o restante da temporada e conta, por time, título, top-N e
+    rebaixamento. As temporadas são divididas em blocos de CHUNK_RUNS, cada
+    um com sua semente derivada de (seed, nº do bloco), e os blocos rodam num
+    pool de processos: o resultado é o mesmo com qualquer número de workers.
+
+    Retorna {"teams", "title", "top", "relegation" (probabilidades, na ordem
+    de standings.teams), "runs", "top_n", "relegation_n", "version", "seconds"}.
+    """
+    t0 = time.perf_counter()
+    T = len(standings.teams)
+    top_n = min(top_n, T)
+    relegation = min(relegation, max(0, T - top_n))
+    home, away, lam_h, lam_a = match_rates(standings)
+    stats = [[int(v) for v in row] for row in standings.stats]
+
+    base = {
+        "teams": T,
+        "home": home, "away": away, "lam_h": lam_h, "lam_a": lam_a,
+        "pts": [row[COL_PTS] for row in stats],
+        "gd": [row[COL_GF] - row[COL_GA] for row in stats],
+        "gf": [row[COL_GF] for row in stats],
+        "points": (standings.pts_win, standings.pts_draw, standings.pts_loss),
+        "top_n": top_n, "rel_n": relegation,
+        "entropy": seed,
+        "vectorized": np is not None,
+    }
+    tasks = []
+    for chunk, start in enumerate(range(0, runs, CHUNK_RUNS)):
+        tasks.append(dict(base, chunk=chunk, runs=min(CHUNK_RUNS, runs - start)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        results = [_simulate_chunk(t) for t in tasks]
+    else:
+        # "spawn": o processo principal tem threads (SDL, fetch) e fork com threads não é seguro
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            results = list(pool.map(_simulate_chunk, tasks))
+
+    title, top, rel = [0] * T, [0] * T, [0] * T
+    for c_title, c_top, c_rel in results:
+        for t in range(T):
+            title[t] += c_title[t]
+            top[t] += c_top[t]
+            rel[t] += c_rel[t]
+
+    n = max(1, runs)
+    return {
+        "teams": list(standings.teams),
+        "title": [c / n for c in title],
+        "top": [c / n for c in top],
+        "relegation": [c / n for c in rel],
+        "runs": runs,
+        "top_n": top_n,
+        "relegation_n": relegation,
+        "version": standings.version,
+        "seconds": time.perf_counter() - t0,
+    }
@@ -0,0 +1,103 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+from news_item import NewsItem
+from news_view import SearchIndex
+
+SNAPSHOT_PATH = "news_cache.snap"
+
+# cabeçalho: magic, versão, tamanho do payload comprimido, crc32 do payload
+_MAGIC = b"UNLS"
+_VERSION = 3
+_HEADER = struct.Struct("<4sHxxII")
+
+
+def _encode(data: dict) -> bytes:
+    news = data.get("news", [])
+    pos = {id(n): i for i, n in enumerate(news)}
+    categories = sorted({n.category for n in news} | set(data.get("_by_category", {})))
+    cat_idx = {c: i for i, c in enumerate(categories)}
+
+    body = {
+        "meta": {k: v for k, v in data.items() if k != "news" and not k.startswith("_")},
+        "categories": categories,
+        # registro: [id, date, title, description, idx categoria, sort_key]
+        "rows": [[n.id, n.date, n.title, n.description, cat_idx[n.category], n.sort_key] for n in news],
+        "by_category": {c: [pos[id(n)] for n in items] for c, items in data.get("_by_category", {}).items()},
+    }
+    search = data.get("_search")
+    if search is not None:
+        body["search"] = search.to_state()
+    raw = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, 6)
+
+
+def _decode(payload) -> dict:
+    body = json.loads(zlib.decompress(payload))
+    categories = body["categories"]
+    news = [NewsItem(nid, date, title, desc, categories[cat], sort_key)
+            for nid, date, title, desc, cat, sort_key in body["rows"]]
+
+    data = dict(body["meta"])
+    data["news"] = news
+    data["_by_category"] = {c: [news[i] for i in ids] for c, ids in body["by_category"].items()}
+    data["_search"] = SearchIndex.from_state(body["search"], news) if "search" in body else SearchIndex(news)
+    return data
+
+
+def save_snapshot(data: dict, path: str = SNAPSHOT_PATH) -> None:
+    """
+    Grava os dados já normalizados (registros + índices) de forma atômica:
+    arquivo temporário no mesmo diretório, fsync e os.replace. Uma queda no
+    meio da escrita deixa o snapshot anterior intacto.
+    """
+    payload = _encode(data)
+    header = _HEADER.pack(_MAGIC, _VERSION, len(payload), zlib.crc32(payload))
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".snap-", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> dict | None:
+    """
+    Lê o snapshot (via mmap) e devolve o dict no formato de normalize_data,
+    com _by_category e _search prontos. None se não existir, for de outra
+    versão ou estiver corrompido.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, length, crc = _HEADER.unpack_from(mm, 0)
+                if magic != _MAGIC or version != _VERSION or _HEADER.size + length != size:
+                    return None
+                payload = memoryview(mm)[_HEADER.size:]
+                try:
+                    if zlib.crc32(payload) != crc:
+                        return None
+                    return _decode(payload)
+                finally:
+                    payload.release()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print("[CACHE] Snapshot inválido:", e)
+        return None
@@ -0,0 +1,235 @@
+try:
+    import numpy as np
+except ImportError:  # opcional: sem numpy, mesmo resultado em Python puro
+    np = None
+
+# colunas da matriz de classificação (uma linha por time)
+COL_P, COL_W, COL_D, COL_L, COL_GF, COL_GA, COL_PTS = range(7)
+N_COLS = 7
+
+DEFAULT_POINTS = {"win": 3, "draw": 1, "loss": 0}
+FORM_LEN = 5
+NO_RESULT = -1
+
+
+def match_score(m: dict):
+    """
+    Placar de uma partida do JSON -> (gols_casa, gols_fora) ou None se não jogada.
+    Aceita "home_goals"/"away_goals" ou "score": "2-1".
+    """
+    hg, ag = m.get("home_goals"), m.get("away_goals")
+    if hg is None or ag is None:
+        score = m.get("score")
+        if not score:
+            return None
+        try:
+            hg, ag = (int(x) for x in str(score).replace("x", "-").split("-"))
+        except ValueError:
+            return None
+    try:
+        hg, ag = int(hg), int(ag)
+    except (TypeError, ValueError):
+        return None
+    if hg < 0 or ag < 0:
+        return None
+    return hg, ag
+
+
+class Standings:
+    """
+    Classificação calculada sobre uma "matriz" de resultados: arrays paralelos
+    casa/fora/gols_casa/gols_fora (uma posição por partida, NO_RESULT = não
+    jogada). O cálculo completo usa bincount do numpy (ou um laço, sem numpy);
+    set_result só desfaz a contribuição antiga da partida e aplica a nova,
+    sem recalcular a temporada.
+    """
+
+    def __init__(self, teams, matches, points_system=None):
+        """
+        teams: nomes/ids dos times (ordem = desempate final)
+        matches: [(rodada, casa, fora, placar|None), ...]
+        """
+        pts = dict(DEFAULT_POINTS, **(points_system or {}))
+        self.pts_win, self.pts_draw, self.pts_loss = pts["win"], pts["draw"], pts["loss"]
+
+        self.teams = list(teams)
+        self._team_idx = {t: i for i, t in enumerate(self.teams)}
+        for _, h, a, _ in matches:
+            for t in (h, a):
+                if t not in self._team_idx:
+                    self._team_idx[t] = len(self.teams)
+                    self.teams.append(t)
+
+        n = len(matches)
+        rounds = [m[0] for m in matches]
+        home = [self._team_idx[m[1]] for m in matches]
+        away = [self._team_idx[m[2]] for m in matches]
+        hg = [m[3][0] if m[3] else NO_RESULT for m in matches]
+        ag = [m[3][1] if m[3] else NO_RESULT for m in matches]
+        self.vectorized = np is not None
+        self._match_idx = {(r, h, a): k for k, (r, h, a) in enumerate(zip(rounds, home, away))}
+
+        # jogos de cada time em ordem de rodada (para a forma recente)
+        by_team = [[] for _ in self.teams]
+        for k in sorted(range(n), key=rounds.__getitem__):
+            by_team[home[k]].append(k)
+            by_team[away[k]].append(k)
+
+        if self.vectorized:
+            self.rounds = np.asarray(rounds, dtype=np.int32)
+            self.home = np.asarray(home, dtype=np.int32)
+            self.away = np.asarray(away, dtype=np.int32)
+            self.hg = np.asarray(hg, dtype=np.int32)
+            self.ag = np.asarray(ag, dtype=np.int32)
+            self._team_matches = [np.asarray(ks, dtype=np.int64) for ks in by_team]
+        else:
+            self.rounds, self.home, self.away, self.hg, self.ag = rounds, home, away, hg, ag
+            self._team_matches = by_team
+
+        self.version = 0
+        self.recompute()
+
+    @classmethod
+    def from_competition(cls, data: dict) -> "Standings":
+        """Monta a partir do campeonato.json (teams, schedule, points_system)."""
+        teams = [t.get("name", t.get("id")) for t in data.get("teams", [])]
+        matches = []
+        for rec in data.get("schedule", []):
+            r = rec.get("round", 0)
+            for m in rec.get("matches", []):
+                if m.get("home") and m.get("away"):
+                    matches.append((r, m["home"], m["away"], match_score(m)))
+        return cls(teams, matches, data.get("competition", {}).get("points_system"))
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    # -------- cálculo completo --------
+    def recompute(self) -> None:
+        """Refaz a matriz inteira a partir dos resultados."""
+        if self.vectorized:
+            self.stats = self._compute_numpy()
+        else:
+            self.stats = self._compute_python()
+        self.version += 1
+
+    def _compute_numpy(self):
+        T = len(self.teams)
+        played = self.hg >= 0
+        h, a = self.home[played], self.away[played]
+        g1, g2 = self.hg[played], self.ag[played]
+        win_h, draw, win_a = g1 > g2, g1 == g2, g1 < g2
+
+        S = np.zeros((T, N_COLS), dtype=np.int64)
+        S[:, COL_P] = np.bincount(h, minlength=T) + np.bincount(a, minlength=T)
+        S[:, COL_W] = np.bincount(h[win_h], minlength=T) + np.bincount(a[win_a], minlength=T)
+        S[:, COL_D] = np.bincount(h[draw], minlength=T) + np.bincount(a[draw], minlength=T)
+        S[:, COL_L] = S[:, COL_P] - S[:, COL_W] - S[:, COL_D]
+        S[:, COL_GF] = np.bincount(h, g1, minlength=T) + np.bincount(a, g2, minlength=T)
+        S[:, COL_GA] = np.bincount(h, g2, minlength=T) + np.bincount(a, g1, minlength=T)
+        S[:, COL_PTS] = S[:, COL_W] * self.pts_win + S[:, COL_D] * self.pts_draw + S[:, COL_L] * self.pts_loss
+        return S
+
+    def _compute_python(self):
+        S = [[0] * N_COLS for _ in self.teams]
+        for k in range(len(self.hg)):
+            self._apply(S, k, 1)
+        return S
+
+    # -------- atualização incremental --------
+    def _apply(self, S, k: int, sign: int) -> None:
+        """Soma (sign=1) ou desfaz (sign=-1) a contribuição da partida k."""
+        g1, g2 = int(self.hg[k]), int(self.ag[k])
+        if g1 < 0:
+            return
+        for t, gf, ga in ((int(self.home[k]), g1, g2), (int(self.away[k]), g2, g1)):
+            row = S[t]
+            row[COL_P] += sign
+            row[COL_GF] += sign * gf
+            row[COL_GA] += sign * ga
+            if gf > ga:
+                row[COL_W] += sign
+                row[COL_PTS] += sign * self.pts_win
+            elif gf == ga:
+                row[COL_D] += sign
+                row[COL_PTS] += sign * self.pts_draw
+            else:
+                row[COL_L] += sign
+                row[COL_PTS] += sign * self.pts_loss
+
+    def match_index(self, round_num: int, home, away):
+        h, a = self._team_idx.get(home), self._team_idx.get(away)
+        return self._match_idx.get((round_num, h, a))
+
+    def set_result(self, round_num: int, home, away, score) -> bool:
+        """
+        Define (ou limpa, score=None) o placar de uma partida e atualiza só as
+        duas linhas envolvidas. False se a partida não existe ou nada mudou.
+        """
+        k = self.match_index(round_num, home, away)
+        if k is None:
+            return False
+        new = score if score is not None else (NO_RESULT, NO_RESULT)
+        if (int(self.hg[k]), int(self.ag[k])) == tuple(new):
+            return False
+        self._apply(self.stats, k, -1)
+        self.hg[k], self.ag[k] = new
+        self._apply(self.stats, k, 1)
+        self.version += 1
+        return True
+
+    def result(self, round_num: int, home, away):
+        k = self.match_index(round_num, home, away)
+        if k is None or self.hg[k] < 0:
+            return None
+        return int(self.hg[k]), int(self.ag[k])
+
+    # -------- consultas --------
+    def order(self) -> list:
+        """Índices dos times do 1º ao último: pontos, saldo, gols pró, ordem original."""
+        S = self.stats
+        if self.vectorized:
+            gd = S[:, COL_GF] - S[:, COL_GA]
+            tie = np.arange(len(self.teams))
+            return np.lexsort((tie, -S[:, COL_GF], -gd, -S[:, COL_PTS])).tolist()
+        return sorted(range(len(self.teams)),
+                      key=lambda t: (-S[t][COL_PTS], -(S[t][COL_GF] - S[t][COL_GA]), -S[t][COL_GF], t))
+
+    def form(self, team, n: int = FORM_LEN) -> str:
+        """Últimos `n` resultados do time, do mais antigo ao mais recente: V/E/D."""
+        t = self._team_idx.get(team)
+        if t is None:
+            return ""
+        ks = self._team_matches[t]
+        if self.vectorized:
+            ks = ks[self.hg[ks] >= 0][-n:]
+            ks = ks.tolist()
+        else:
+            ks = [k for k in ks if self.hg[k] >= 0][-n:]
+        out = []
+        for k in ks:
+            g1, g2 = int(self.hg[k]), int(self.ag[k])
+            if self.home[k] != t:
+                g1, g2 = g2, g1
+            out.append("V" if g1 > g2 else ("E" if g1 == g2 else "D"))
+        return "".join(out)
+
+    def table(self, form_len: int = FORM_LEN) -> list:
+        """Linhas da classificação, já ordenadas."""
+        rows = []
+        for pos, t in enumerate(self.order(), 1):
+            s = [int(v) for v in self.stats[t]]
+            rows.append({
+                "pos": pos,
+                "team": self.teams[t],
+                "played": s[COL_P],
+                "won": s[COL_W],
+                "drawn": s[COL_D],
+                "lost": s[COL_L],
+                "gf": s[COL_GF],
+                "ga": s[COL_GA],
+                "gd": s[COL_GF] - s[COL_GA],
+                "points": s[COL_PTS],
+                "form": self.form(self.teams[t], form_len),
+            })
+        return rows
@@ -0,0 +1,90 @@
+"""
+HTTPPool com um servidor local keep-alive: respostas sem corpo (304, 204,
+HEAD) abertas em streaming devolvem a conexão ao pool.
+"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_pool import HTTPPool  # noqa: E402
+
+BODY = b'{"news": []}'
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/empty":
+            self.send_response(204)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connection_reused_after_304(base_url):
+    pool = HTTPPool(timeout=5)
+    with pool.open("GET", base_url + "/feed") as resp:
+        assert resp.status == 200
+        assert b"".join(resp.iter_chunks()) == BODY
+    for _ in range(3):
+        with pool.open("GET", base_url + "/feed", headers={"If-None-Match": ETAG}) as resp:
+            assert resp.status == 304  # sem ler o corpo, como o stream_feed
+    with pool.open("GET", base_url + "/feed") as resp:
+        assert b"".join(resp.iter_chunks()) == BODY
+
+    st = pool.stats()
+    pool.close()
+    assert st["connections_opened"] == 1
+    assert st["reused"] == 4
+    assert st["idle"] == 1
+    assert st["errors"] == 0
+
+
+def test_connection_reused_after_204_and_head(base_url):
+    pool = HTTPPool(timeout=5)
+    with pool.open("GET", base_url + "/empty") as resp:
+        assert resp.status == 204
+    with pool.open("HEAD", base_url + "/feed") as resp:
+        assert resp.status == 200
+        assert b"".join(resp.iter_chunks()) == b""
+    with pool.open("GET", base_url + "/feed") as resp:
+        assert b"".join(resp.iter_chunks()) == BODY
+
+    st = pool.stats()
+    pool.close()
+    assert st["connections_opened"] == 1
+    assert st["reused"] == 2
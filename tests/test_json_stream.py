@@ -0,0 +1,71 @@
+"""
+FeedStreamParser recebendo o documento em pedaços de tamanho aleatório
+(cortando strings, números, escapes e literais no meio) dá o mesmo que
+json.loads do documento inteiro.
+"""
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from json_stream import FeedStreamParser  # noqa: E402
+
+
+def make_doc(rnd: random.Random) -> dict:
+    news = []
+    for k in range(rnd.randint(0, 30)):
+        news.append({
+            "id": rnd.choice([k, str(k), None]),
+            "date": rnd.choice(["01/03/2026", "", "3 Mar"]),
+            "title": f"Notícia \"{k}\" — ação\\x {'é' * rnd.randint(0, 5)} ",
+            "description": rnd.choice(["", "a\nb\tc", "\U0001f600 emoji"]),
+            "category": "Mensagens",
+            "score": rnd.choice([0, -1.5e3, 12345678901234567890, True, False, None]),
+            "tags": [rnd.random() for _ in range(rnd.randint(0, 3))],
+            "extra": {"nested": {"list": [1, [2, {}], []]}},
+        })
+    return {"coach_name": "Técnico", "sidebar_date": "Seg\n1 Jan", "news": news,
+            "after": [1, 2, 3], "flag": False, "nothing": None}
+
+
+def split_randomly(rnd: random.Random, text: str) -> list:
+    chunks, i = [], 0
+    while i < len(text):
+        n = rnd.choice([1, 1, 2, 3, 7, 64, 500])
+        chunks.append(text[i:i + n])
+        i += n
+    return chunks
+
+
+def parse_chunks(chunks) -> dict:
+    parser = FeedStreamParser("news")
+    out = {"news": []}
+    events = []
+    for c in chunks:
+        events += parser.feed(c)
+    events += parser.close()
+    for ev in events:
+        if ev[0] == "item":
+            out["news"].append(ev[1])
+        else:
+            out[ev[1]] = ev[2]
+    return out
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_chunk_splits_match_json_loads(seed):
+    rnd = random.Random(seed)
+    doc = make_doc(rnd)
+    text = json.dumps(doc, ensure_ascii=rnd.random() < 0.5, indent=rnd.choice([None, 0, 2]))
+    assert parse_chunks(split_randomly(rnd, text)) == json.loads(text)
+
+
+def test_truncated_document_fails_on_close():
+    text = json.dumps(make_doc(random.Random(1)))
+    rnd = random.Random(2)
+    with pytest.raises(ValueError):
+        parse_chunks(split_randomly(rnd, text[:-1]))
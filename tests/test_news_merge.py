@@ -0,0 +1,84 @@
+"""
+merge_data (refresh incremental) tem que dar exatamente o que um rebuild do
+feed novo daria: mesma ordem mestre, mesmas abas e mesmas buscas, inclusive
+com muitas notícias na mesma data (desempate pela ordem do feed).
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui_news_layout import ALL_CATEGORIES, merge_data, normalize_data, normalize_item  # noqa: E402
+from date_keys import current_year  # noqa: E402
+
+DATES = ["Qua 01 Mar TAR", "1.3.26 TAR", "Qui 02 Mar NTE", "—"]  # as duas primeiras caem na mesma chave
+WORDS = ["gol", "vitória", "treino", "lesão", "ano", "novo", "clássico", "reforço"]
+QUERIES = ["", "gol", "ano novo", "tre", "reforços", "x"]
+
+
+def raw_item(rnd: random.Random, k: int) -> dict:
+    return {
+        "id": f"n{k}",
+        "date": rnd.choice(DATES),
+        "title": " ".join(rnd.sample(WORDS, 3)) + f" {k}",
+        "description": " ".join(rnd.sample(WORDS, 2)),
+        "category": rnd.choice(ALL_CATEGORIES),
+    }
+
+
+def mutate(rnd: random.Random, feed: list, next_id: int) -> tuple:
+    feed = [dict(it) for it in feed]
+    rnd.shuffle(feed)  # o feed pode mudar a ordem de notícias da mesma data
+    for _ in range(rnd.randint(0, 4)):
+        if feed:
+            feed.pop(rnd.randrange(len(feed)))
+    for _ in range(rnd.randint(0, 4)):
+        if feed:
+            it = feed[rnd.randrange(len(feed))]
+            field = rnd.choice(["date", "title", "category"])
+            it[field] = raw_item(rnd, next_id)[field]
+    for _ in range(rnd.randint(0, 4)):
+        feed.insert(rnd.randint(0, len(feed)), raw_item(rnd, next_id))
+        next_id += 1
+    return feed, next_id
+
+
+def incremental(old: dict, feed: list) -> dict:
+    known = {n.id: n for n in old["news"]}
+    seen, year = {}, current_year()
+    items = [n for n in (normalize_item(it, known, seen, year) for it in feed) if n is not None]
+    return merge_data(old, {"news": items}, known)
+
+
+def ids(news) -> list:
+    return [n.id for n in news]
+
+
+def test_merge_matches_rebuild_with_equal_dates():
+    rnd = random.Random(16)
+    feed = [raw_item(rnd, k) for k in range(60)]
+    next_id = len(feed)
+    data = normalize_data({"news": feed})
+    for _ in range(200):
+        feed, next_id = mutate(rnd, feed, next_id)
+        data = incremental(data, feed)
+        ref = normalize_data({"news": [dict(it) for it in feed]})
+
+        assert ids(data["news"]) == ids(ref["news"])
+        for c in ALL_CATEGORIES:
+            assert ids(data["_by_category"].get(c, [])) == ids(ref["_by_category"][c]), c
+        for q in QUERIES:
+            got = [data["news"][i].id for i in data["_search"].query(q)]
+            want = [ref["news"][i].id for i in ref["_search"].query(q)]
+            assert got == want, q
+
+
+def test_reordered_feed_is_not_skipped():
+    feed = [{"id": f"n{k}", "date": "Qua 01 Mar TAR", "title": f"t{k}", "category": ALL_CATEGORIES[0]}
+            for k in range(5)]
+    data = normalize_data({"news": [dict(it) for it in feed]})
+    feed.reverse()
+    data = incremental(data, feed)
+    assert ids(data["news"]) == [f"id:n{k}" for k in reversed(range(5))]
+    assert ids(data["_by_category"][ALL_CATEGORIES[0]]) == ids(data["news"])
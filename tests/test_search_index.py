@@ -0,0 +1,96 @@
+"""
+SearchIndex tem que dar o mesmo conjunto que o filtro original por
+substring (`texto in título or texto in descrição`), sem diferenciar
+maiúsculas, acentos nem plural/singular, com os acertos no título primeiro. Vale também
+para o índice atualizado por updated() e para o que volta do snapshot.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_item import NewsItem  # noqa: E402
+from news_view import SearchIndex, fold_text, sort_news, stem_text  # noqa: E402
+
+WORDS = ["Jogo", "jogador", "Ano", "novo", "Ano Novo", "Competições", "competicao", "ação", "logo",
+         "Técnico", "treino", "São", "Paulo", "golo", "x", "é"]
+QUERIES = ["ogo", "ano novo", "ANO NOVO", "competicoes", "competição", "acao", "ção", "o", "é",
+           "sao paulo", "  jogo  ", "x", "ogo j", "inexistente", "competicao", "Competições nacionais",
+           "jogos", "acoes"]
+
+
+def make_news(rnd: random.Random, n: int, start: int = 0) -> list:
+    return [NewsItem(f"n{k}", "—", " ".join(rnd.choices(WORDS, k=rnd.randint(1, 5))),
+                     " ".join(rnd.choices(WORDS, k=rnd.randint(0, 8))), "Mensagens", rnd.randint(0, 5))
+            for k in range(start, start + n)]
+
+
+def expected(news, text):
+    q = fold_text(text.strip())
+    sq = stem_text(q)
+
+    def hit(s):
+        s = fold_text(s)
+        return q in s or sq in stem_text(s)
+
+    title = [i for i, n in enumerate(news) if hit(n.title)]
+    desc = [i for i, n in enumerate(news) if not hit(n.title) and hit(n.description)]
+    return title + desc
+
+
+def check(idx, news):
+    for q in QUERIES:
+        idx._reset_query()
+        assert idx.query(q) == expected(news, q), q
+
+
+def test_matches_substring_filter():
+    news = sort_news(make_news(random.Random(4), 300))
+    check(SearchIndex(news), news)
+
+
+def test_plural_matches_singular():
+    news = [NewsItem("a", "—", "Competições", "", "Mensagens", 0),
+            NewsItem("b", "—", "Competição nacional", "", "Mensagens", 0),
+            NewsItem("c", "—", "Treino", "", "Mensagens", 0)]
+    idx = SearchIndex(news)
+    assert idx.query("competicao") == [0, 1]
+    assert idx.query("competições") == [0, 1]
+
+
+def test_typing_plural_widens_when_needed():
+    news = sort_news(make_news(random.Random(7), 300))
+    idx = SearchIndex(news)
+    text = "competicoes"
+    for k in range(1, len(text) + 1):
+        assert idx.query(text[:k]) == expected(news, text[:k]), text[:k]
+
+
+def test_typing_only_narrows():
+    news = sort_news(make_news(random.Random(5), 300))
+    idx = SearchIndex(news)
+    text = "ano novo jogador"
+    prev = None
+    for k in range(1, len(text) + 1):
+        got = idx.query(text[:k])
+        assert got == expected(news, text[:k])
+        if prev is not None and text[:k].strip() and text[:k - 1].strip():
+            assert set(got) <= set(prev)
+        prev = got
+
+
+def test_updated_and_state_round_trip():
+    rnd = random.Random(6)
+    news = sort_news(make_news(rnd, 200))
+    idx = SearchIndex.from_state(SearchIndex(news).to_state(), news)
+    next_id = len(news)
+    for _ in range(20):
+        removed = rnd.sample(news, rnd.randint(0, 10))
+        added = make_news(rnd, rnd.randint(0, 10), next_id)
+        next_id += len(added)
+        gone = {id(n) for n in removed}
+        news = sort_news([n for n in news if id(n) not in gone] + added)
+        idx = idx.updated(removed, added, news)
+        check(idx, news)
+    check(SearchIndex.from_state(idx.to_state(), news), news)
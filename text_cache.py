@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class TextCache:
+    """
+    Cache LRU das Surfaces de texto (font.render).
+
+    Chave: (texto, fonte, cor, antialias). A fonte entra na chave pelo próprio
+    objeto, então ela fica viva enquanto tiver entrada no cache. O limite é em
+    bytes de pixel (pitch * altura); ao passar do limite, as entradas menos
+    usadas saem primeiro. As Surfaces devolvidas são compartilhadas: só blit,
+    nunca desenhe nelas.
+    """
+
+    def __init__(self, max_bytes: int = TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), bool(antialias))
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        size = surf.get_pitch() * surf.get_height()
+        if size > self.max_bytes:
+            return surf
+
+        self._entries[key] = surf
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+            self.evictions += 1
+        return surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Substituto de font.render(text, antialias, color) com cache."""
+    return TEXT_CACHE.render(font, text, color, antialias)
@@ -1,30 +1,50 @@
+import codecs
+import hashlib
 import json
 import os
 import sys
+import time
 import pygame
-import re
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from competitions_view import CompetitionsView
-
-pygame.init()
-pygame.display.set_caption("Noticias (Pygame Mock)")
+from bg_cache import BG_LOADED, load_scaled_bg
+from competitions_view import SIM_DONE, CompetitionsView
+from dirty_regions import DirtyRegions
+from fetch_worker import FetchWorker, FEED_LOADED, FEED_PARTIAL, post_feed_partial
+from http_pool import HTTP_POOL
+from json_stream import FeedStreamParser
+from news_list import VirtualList
+from font_registry import FONTS, get_font
+from text_cache import TEXT_CACHE, render_text
+from webhook_outbox import WebhookOutbox
+from date_keys import current_year, parse_date_key
+from news_item import NewsItem, content_id
+from news_view import (NewsView, SearchIndex, diff_news, feed_positions, in_feed_order,
+                       index_by_category, merge_news, sort_news)
+from snapshot import SNAPSHOT_PATH, load_snapshot, save_snapshot
 
 # -----------------------------
 # Remote JSON + Webhook
 # -----------------------------
 JSON_URL = "https://raw.githubusercontent.com/michelbr84/ui_news_layout/refs/heads/main/news_data.json"
 WEBHOOK_URL = "https://michelbr84.app.n8n.cloud/webhook/ui_news_layout"
-CACHE_PATH = "news_cache.json"  # cache local (fallback se falhar internet)
+CACHE_PATH = "news_cache.json"  # cache legado em JSON (só leitura, migração)
+# o cache local (fallback se falhar internet) é o snapshot: snapshot.SNAPSHOT_PATH
+CACHE_META_PATH = "news_cache.meta.json"  # ETag/Last-Modified + hora do último download
+CACHE_TTL_SEC = 300  # dentro disso o cache é servido sem ir à rede
 
 HTTP_TIMEOUT_SEC = 6
+STREAM_FIRST_SCREEN = 40  # notícias entregues antes do download terminar
+PAYLOAD_HOLD_MAX = 16 * 1024 * 1024  # bytes guardados sem parse até comparar o hash do payload
+MERGE_MAX_CHANGES = 0.25  # acima dessa fração de itens mudados, reconstrói em vez de fazer merge
 
 # -----------------------------
 # Fullscreen (real)
+# Preenchidos por App.init_display() dentro de run(): importar o módulo
+# (parse_date_key, normalize_data...) não abre janela.
 # -----------------------------
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
+screen = None
+WIDTH, HEIGHT = 0, 0
 FPS = 60
 
 BG_IMAGE_PATH = "bg.png"  # opcional
@@ -82,55 +102,47 @@ DEFAULT_JSON = {
 }
 
 # -----------------------------
-# Utils HTTP (no requests)
+# Utils HTTP (no requests) - conexões keep-alive via http_pool
 # -----------------------------
-def http_get_json(url: str, timeout: int = HTTP_TIMEOUT_SEC) -> dict:
-    req = urllib.request.Request(
-        url,
-        method="GET",
-        headers={
-            "User-Agent": "ui_news_layout/1.0",
-            "Accept": "application/json",
-            "Cache-Control": "no-cache",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
-    # tenta utf-8, senão fallback
-    try:
-        txt = raw.decode("utf-8")
-    except Exception:
-        txt = raw.decode("latin-1", errors="replace")
-    return json.loads(txt)
-
 def http_post_json(url: str, payload: dict, timeout: int = HTTP_TIMEOUT_SEC) -> tuple[int, str]:
     data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    req = urllib.request.Request(
+    resp = HTTP_POOL.request(
+        "POST",
         url,
-        data=data,
-        method="POST",
+        body=data,
         headers={
-            "User-Agent": "ui_news_layout/1.0",
             "Content-Type": "application/json; charset=utf-8",
             "Accept": "application/json,text/plain,*/*",
         },
+        timeout=timeout,
     )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        status = getattr(resp, "status", 200)
-        raw = resp.read()
+    resp.raise_for_status()
+    return resp.status, resp.text()
+
+def save_cache(data: dict) -> bool:
+    # snapshot binário (registros normalizados + índices), gravado atomicamente
     try:
-        txt = raw.decode("utf-8")
-    except Exception:
-        txt = raw.decode("latin-1", errors="replace")
-    return status, txt
+        save_snapshot(data)
+        return True
+    except Exception as e:
+        print("[CACHE] Falha ao gravar snapshot:", e)
+        return False
 
-def save_cache(data: dict) -> None:
+def save_cache_meta(meta: dict) -> None:
     try:
-        with open(CACHE_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(CACHE_META_PATH, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
     except Exception:
         pass
 
+def load_cache_meta() -> dict:
+    try:
+        with open(CACHE_META_PATH, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else {}
+    except Exception:
+        return {}
+
 def load_cache() -> dict | None:
     if not os.path.exists(CACHE_PATH):
         return None
@@ -140,80 +152,64 @@ def load_cache() -> dict | None:
     except Exception:
         return None
 
+def load_cached_data() -> dict | None:
+    """Cache já normalizado: snapshot; senão o JSON legado passando por normalize_data."""
+    d = load_snapshot()
+    if d is not None:
+        return d
+    cached = load_cache()
+    if cached is not None:
+        return normalize_data(cached)
+    return None
+
 # -----------------------------
 # Parsing/sorting helpers
 # -----------------------------
-def _norm_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip())
-
-def parse_date_key(date_str: str):
+def normalize_item(item, known: dict | None = None, seen: dict | None = None,
+                   year: int | None = None) -> NewsItem | None:
     """
-    Converte strings do tipo:
-      - "Qui 13 Jan NTE"
-      - "Qua 31 Dez TAR"
-      - "25.9.04 TAR"
-    em uma chave ordenável (year, month, day, period_rank).
-    Se falhar, retorna None.
+    Normaliza uma notícia crua; None se ela deve ser descartada.
+    O id é o "id" do feed ou um hash de data+título+categoria (`seen` conta
+    repetições para desempatar). Se `known` (id -> registro atual) tem o
+    mesmo conteúdo, devolve o registro antigo sem parsear a data de novo.
+    `year` (ano para datas sem ano) deve ser pego uma vez por lote.
     """
-    s = _norm_spaces(str(date_str))
+    if not isinstance(item, dict):
+        return None
+    date = str(item.get("date", "")).strip() or "—"
+    title = str(item.get("title", "")).strip()
+    desc = str(item.get("description", "")).strip() or "—"
+    cat = str(item.get("category", "")).strip()
 
-    period_rank = {
-        "MAD": 0, "MAN": 0, "MNH": 0, "AM": 0,
-        "TAR": 1, "PM": 1,
-        "NTE": 2, "NOI": 2, "NIGHT": 2
-    }
+    if not title:
+        return None
 
-    months = {
-        # PT
-        "JAN": 1, "FEV": 2, "MAR": 3, "ABR": 4, "MAI": 5, "JUN": 6,
-        "JUL": 7, "AGO": 8, "SET": 9, "OUT": 10, "NOV": 11, "DEZ": 12,
-        # EN
-        "FEB": 2, "APR": 4, "MAY": 5, "AUG": 8, "SEP": 9, "OCT": 10, "DEC": 12
-    }
+    if cat not in ALL_CATEGORIES:
+        cat = "Mensagens"
 
-    # formato numérico: d.m.yy + período
-    m = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})\s*([A-Za-z]{2,5})?", s, re.IGNORECASE)
-    if m:
-        day = int(m.group(1))
-        month = int(m.group(2))
-        year_raw = m.group(3)
-        year = int(year_raw)
-        if year < 100:
-            year = 2000 + year if year <= 79 else 1900 + year
-        per = (m.group(4) or "").upper()
-        pr = period_rank.get(per, -1)
-        return (year, month, day, pr)
-
-    tokens = s.split(" ")
-    if len(tokens) >= 3:
-        def try_parse_at(idx_day, idx_month, idx_period):
-            try:
-                day = int(re.sub(r"\D", "", tokens[idx_day]))
-                mon = tokens[idx_month].upper()[:3]
-                month = months.get(mon)
-                if not month:
-                    return None
-                per = tokens[idx_period].upper() if idx_period < len(tokens) else ""
-                pr = period_rank.get(per, -1)
-                # sem ano -> tenta inferir pelo "agora"
-                year = datetime.now().year
-                return (year, month, day, pr)
-            except Exception:
-                return None
-
-        key = try_parse_at(1, 2, 3) if len(tokens) >= 4 else None
-        if key:
-            return key
-        key = try_parse_at(0, 1, 2) if len(tokens) >= 3 else None
-        if key:
-            return key
+    raw_id = item.get("id")
+    if raw_id is not None and str(raw_id).strip():
+        nid = "id:" + str(raw_id).strip()
+    else:
+        nid = content_id(date, title, cat)
+    if seen is not None:
+        k = seen.get(nid, 0)
+        seen[nid] = k + 1
+        if k:
+            nid = f"{nid}#{k}"
 
-    return None
+    n = NewsItem(nid, date, title, desc, cat)
+    old = known.get(nid) if known else None
+    if old is not None and old.same_content(n):
+        return old
 
-def normalize_data(data: dict) -> dict:
-    if not isinstance(data, dict):
-        data = {}
+    n.sort_key = parse_date_key(date, year)
+    return n
 
+def placeholder_item(description: str) -> NewsItem:
+    return NewsItem("", "—", "Sem notícias", description, "Mensagens")
+
+def _apply_defaults(data: dict) -> None:
     coach = data.get("coach_name")
     if not isinstance(coach, str) or not coach.strip():
         data["coach_name"] = DEFAULT_JSON["coach_name"]
@@ -222,65 +218,281 @@ def normalize_data(data: dict) -> dict:
     if not isinstance(sbd, str) or not sbd.strip():
         data["sidebar_date"] = DEFAULT_JSON["sidebar_date"]
 
+def finish_normalized(data: dict, normalized: list) -> dict:
+    """Completa `data` com os itens já normalizados: defaults, ordem mestre e índices."""
+    if not isinstance(data, dict):
+        data = {}
+    _apply_defaults(data)
+
+    # ordem mestre + índice por categoria: trocar de aba vira lookup
+    normalized = sort_news(normalized)
+    data["news"] = normalized
+    data["_by_category"] = index_by_category(normalized, ALL_CATEGORIES)
+    data["_search"] = SearchIndex(normalized)
+    return data
+
+def normalize_data(data: dict) -> dict:
+    if not isinstance(data, dict):
+        data = {}
+
     news = data.get("news")
     if not isinstance(news, list):
         news = []
 
     normalized = []
+    seen = {}
+    year = current_year()
     for item in news:
-        if not isinstance(item, dict):
-            continue
-        date = str(item.get("date", "")).strip() or "—" if "date" in item else str(item.get("date", "")).strip()
-        date = str(item.get("date", "")).strip() or "—"
-        title = str(item.get("title", "")).strip()
-        desc = str(item.get("description", "")).strip() or "—"
-        cat = str(item.get("category", "")).strip()
-
-        if not title:
-            continue
-
-        if cat not in ALL_CATEGORIES:
-            cat = "Mensagens"
-
-        sort_key = parse_date_key(date)
-
-        normalized.append({
-            "date": date,
-            "title": title,
-            "description": desc,
-            "category": cat,
-            "_sort_key": sort_key
-        })
+        n = normalize_item(item, seen=seen, year=year)
+        if n is not None:
+            normalized.append(n)
+    return finish_normalized(data, normalized)
 
-    data["news"] = normalized
-    return data
+def merge_data(old: dict, d: dict, known: dict) -> dict:
+    """
+    Aplica o feed novo `d` (campos de topo + "news" normalizado, sem ordem
+    nem índices) sobre o store `old` só com inserções, alterações e remoções
+    (por id). `old` não é modificado (a UI continua lendo dele); o que não
+    mudou é compartilhado. Sem mudança nenhuma devolve o próprio `old`.
+    Muitas mudanças de uma vez: reconstrói tudo, que sai mais barato.
+    """
+    items = d.pop("news")
+    _apply_defaults(d)
+    prev = old.get("_delta")
+    if prev is not None:
+        prev.base = None  # a UI já aplicou (ou vai cair no set_data completo)
+    delta = diff_news(known, items)
+    feed_pos = feed_positions(items)
+    meta = {k: v for k, v in old.items() if k != "news" and not k.startswith("_")}
+    if not delta and meta == d and in_feed_order(old["news"], feed_pos):
+        return old
+    if len(delta) > MERGE_MAX_CHANGES * max(len(known), 1):
+        return finish_normalized(d, items)
+    news, by_cat, search = merge_news(old["news"], old["_by_category"], old["_search"], delta, feed_pos)
+    delta.base = old
+    d["news"] = news
+    d["_by_category"] = by_cat
+    d["_search"] = search
+    d["_delta"] = delta
+    return d
+
+def stream_feed(url: str, etag: str | None = None, last_modified: str | None = None,
+                on_partial=None, known: dict | None = None, prev_hash: str | None = None,
+                timeout: int = HTTP_TIMEOUT_SEC) -> tuple[int, dict | None, dict, str | None]:
+    """
+    GET condicional com o corpo lido e parseado em streaming: cada notícia é
+    normalizada assim que chega, sem montar o documento inteiro em memória.
+    Com `on_partial`, as primeiras STREAM_FIRST_SCREEN notícias são entregues
+    (já normalizadas) antes do download terminar.
+
+    O corpo (já descomprimido) é hasheado enquanto chega. Com `prev_hash`
+    (hash do payload que gerou os dados atuais), os pedaços são só guardados
+    (até PAYLOAD_HOLD_MAX bytes) e o parse fica para o fim: se o hash bater,
+    nada é parseado nem normalizado e os dados voltam None.
+
+    Retorna (status, dados, headers, hash). Dados é None em 304 ou payload
+    igual; senão tem os campos de topo e "news" normalizado, ainda sem
+    ordem mestre nem índices.
+    """
+    headers = {
+        "Accept": "application/json",
+        "Cache-Control": "no-cache",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    with HTTP_POOL.open("GET", url, headers=headers, timeout=timeout) as resp:
+        if resp.status == 304:
+            return 304, None, resp.headers, prev_hash
+        resp.raise_for_status()
+
+        parser = FeedStreamParser("news")
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        data, items, seen = {}, [], {}
+        year = current_year()
+        partial_sent = on_partial is None
+
+        def consume(events):
+            for ev in events:
+                if ev[0] == "item":
+                    n = normalize_item(ev[1], known, seen, year)
+                    if n is not None:
+                        items.append(n)
+                else:
+                    data[ev[1]] = ev[2]
+
+        def feed(chunk):
+            nonlocal partial_sent
+            consume(parser.feed(decoder.decode(chunk)))
+            if not partial_sent and len(items) >= STREAM_FIRST_SCREEN:
+                partial_sent = True
+                on_partial(finish_normalized(dict(data), list(items)))
+
+        hasher = hashlib.blake2b(digest_size=16)
+        held, held_bytes = [], 0
+        holding = prev_hash is not None
+        if holding:
+            partial_sent = True  # já há dados na tela
+
+        for chunk in resp.iter_chunks():
+            hasher.update(chunk)
+            if holding:
+                held.append(chunk)
+                held_bytes += len(chunk)
+                if held_bytes <= PAYLOAD_HOLD_MAX:
+                    continue
+                # payload grande demais para segurar: volta ao streaming
+                holding = False
+                for c in held:
+                    feed(c)
+                held = []
+                continue
+            feed(chunk)
+
+        digest = hasher.hexdigest()
+        if digest == prev_hash:
+            return resp.status, None, resp.headers, digest
+        for c in held:
+            feed(c)
+        consume(parser.feed(decoder.decode(b"", final=True)))
+        consume(parser.close())
+
+    data["news"] = items
+    return resp.status, data, resp.headers, digest
+
+# último resultado normalizado, quando foi validado com o servidor, hash do
+# payload que o gerou e id -> registro (usados só pela thread de fetch / startup)
+_last_data = None
+_last_checked = 0.0
+_last_hash = None
+_last_known = {}
+_last_on_disk = False  # _last_data já está gravado no snapshot
+
+def _remember(d: dict, payload_hash: str | None, on_disk: bool) -> None:
+    global _last_data, _last_hash, _last_known, _last_on_disk
+    if d is not _last_data:
+        _last_known = {n.id: n for n in d["news"]}
+    _last_data, _last_hash, _last_on_disk = d, payload_hash, on_disk
+
+def cache_is_fresh() -> bool:
+    return _last_data is not None and (time.time() - _last_checked) < CACHE_TTL_SEC
+
+def expire_cache() -> None:
+    """Força o próximo fetch a revalidar com o servidor (ex.: tecla R)."""
+    global _last_checked
+    _last_checked = 0.0
+
+def fetch_data_remote_or_cache(on_partial=None) -> dict:
+    """
+    Política stale-while-revalidate:
+      - dentro do TTL devolve o último resultado sem ir à rede;
+      - senão faz GET condicional; 304 devolve o mesmo objeto de antes
+        (sem parse, sem normalize_data, sem regravar o cache);
+      - dados que vieram do JSON legado (ainda sem snapshot) são gravados
+        uma vez no snapshot mesmo sem mudança no feed;
+      - 200 com o mesmo hash de payload devolve o mesmo objeto sem parsear,
+        normalizar nem regravar o cache (só os validadores);
+      - 200 diferente normaliza em streaming (on_partial recebe a primeira
+        tela) e faz merge por id sobre o último resultado; grava cache +
+        validadores;
+      - sem rede: último resultado/cache local; sem cache: DEFAULT_JSON.
+    """
+    global _last_checked
+    if cache_is_fresh():
+        return _last_data
+
+    meta = load_cache_meta()
+    have_copy = _last_data is not None or os.path.exists(SNAPSHOT_PATH) or os.path.exists(CACHE_PATH)
 
-def fetch_data_remote_or_cache() -> dict:
     # 1) tenta remoto
     try:
-        d = http_get_json(JSON_URL)
-        d = normalize_data(d)
-        save_cache(d)
+        status, d, headers, digest = stream_feed(
+            JSON_URL,
+            etag=meta.get("etag") if have_copy else None,
+            last_modified=meta.get("last_modified") if have_copy else None,
+            on_partial=on_partial,
+            known=_last_known,
+            prev_hash=_last_hash if _last_data is not None else None,
+        )
+        if status == 304:
+            if _last_data is None:
+                cached = load_snapshot()
+                on_disk = cached is not None
+                if cached is None:
+                    cached = load_cached_data()
+                if cached is None:
+                    raise ValueError("304 sem cache local")
+                _remember(cached, None, on_disk)
+            if not _last_on_disk:
+                _remember(_last_data, _last_hash, save_cache(_last_data))
+            _last_checked = time.time()
+            return _last_data
+
+        if d is None:
+            d = _last_data  # mesmo payload: nada a parsear nem gravar
+        elif _last_data is not None:
+            d = merge_data(_last_data, d, _last_known)
+        else:
+            d = finish_normalized(d, d.pop("news"))
+        saved = (d is _last_data and _last_on_disk) or save_cache(d)
+        save_cache_meta({
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            # só vale para o snapshot se ele foi gravado com estes dados
+            "payload_hash": digest if saved else None,
+        })
+        _remember(d, digest, saved)
+        _last_checked = time.time()
         return d
     except Exception as e:
         print("[JSON] Falha remoto:", e)
 
-    # 2) tenta cache
-    cached = load_cache()
+    # 2) tenta cache (o que já está em memória é o mesmo conteúdo)
+    if _last_data is not None:
+        return _last_data
+    cached = load_cached_data()
     if cached is not None:
-        return normalize_data(cached)
+        return cached
 
     # 3) fallback default
     return normalize_data(DEFAULT_JSON)
 
+def load_startup_data() -> tuple[dict, bool]:
+    """
+    Dados para o primeiro frame: o cache local na hora, sem esperar a rede.
+    Retorna (dados, precisa_revalidar). Sem cache, abre com a lista vazia e
+    o download (em streaming) vai preenchendo a tela pelo FetchWorker.
+    """
+    global _last_checked
+    meta = load_cache_meta()
+    cached = load_snapshot()
+    # o hash do payload no meta só descreve o snapshot (não o JSON legado)
+    payload_hash = meta.get("payload_hash")
+    on_disk = cached is not None
+    if cached is None:
+        cached = load_cached_data()
+        payload_hash = None
+    if cached is None:
+        return finish_normalized({}, []), True
+    _remember(cached, payload_hash, on_disk)
+    _last_checked = float(meta.get("fetched_at") or 0.0)
+    return _last_data, not cache_is_fresh()
+
 # -----------------------------
 # Responsive scaling
 # Base layout reference: 800x600
 # -----------------------------
 BASE_W, BASE_H = 800, 600
-sx = WIDTH / BASE_W
-sy = HEIGHT / BASE_H
-s_font = (sx + sy) / 2.0
+sx = sy = s_font = 1.0
+
+def set_scale(width: int, height: int) -> None:
+    global sx, sy, s_font
+    sx = width / BASE_W
+    sy = height / BASE_H
+    s_font = (sx + sy) / 2.0
 
 def Sx(v: float) -> int:
     return int(round(v * sx))
@@ -297,14 +509,18 @@ def clamp(v: int, lo: int, hi: int) -> int:
 # -----------------------------
 # Fonts (scaled)
 # -----------------------------
-def get_font(size, bold=False):
-    return pygame.font.SysFont("arial", size, bold=bold)
-
-FONT_12 = get_font(Sf(12))
-FONT_14 = get_font(Sf(14))
-FONT_16 = get_font(Sf(16))
-FONT_22 = get_font(Sf(22), bold=True)
-FONT_28 = get_font(Sf(28), bold=True)
+# get_font vem do font_registry: Font resolvido uma vez e cacheado por (size, bold)
+# FONT_* são criadas em App.init_fonts(), depois que a escala é conhecida
+FONT_12 = FONT_14 = FONT_16 = FONT_22 = FONT_28 = None
+
+def init_fonts() -> None:
+    global FONT_12, FONT_14, FONT_16, FONT_22, FONT_28
+    pygame.font.init()
+    FONT_12 = get_font(Sf(12))
+    FONT_14 = get_font(Sf(14))
+    FONT_16 = get_font(Sf(16))
+    FONT_22 = get_font(Sf(22), bold=True)
+    FONT_28 = get_font(Sf(28), bold=True)
 
 # -----------------------------
 # Helpers
@@ -320,7 +536,7 @@ def beveled_panel(surface, rect, fill, border_outer, border_inner=None, radius=0
         pygame.draw.rect(surface, border_inner, inner, max(1, Sx(1)), border_radius=radius)
 
 def draw_text(surface, text, font, color, rect, align="center"):
-    img = font.render(text, True, color)
+    img = render_text(font, text, color)
     r = img.get_rect()
     if align == "center":
         r.center = rect.center
@@ -345,13 +561,13 @@ def draw_text_wrapped(surface, text, font, color, x, y, max_width, line_height,
             if line:
                 if clip_bottom is not None and cur_y + line_height > clip_bottom:
                     return cur_y
-                surface.blit(font.render(line, True, color), (x, cur_y))
+                surface.blit(render_text(font, line, color), (x, cur_y))
                 cur_y += line_height
             line = w
     if line:
         if clip_bottom is not None and cur_y + line_height > clip_bottom:
             return cur_y
-        surface.blit(font.render(line, True, color), (x, cur_y))
+        surface.blit(render_text(font, line, color), (x, cur_y))
         cur_y += line_height
     return cur_y
 
@@ -365,18 +581,8 @@ def button(surface, rect, label, *, active=False, hovered=False, small=False):
     draw_text(surface, label, font, color, rect, align="center")
 
 def fit_font_for_multiline(lines, max_w, max_h, start_px, bold=False, min_px=10):
-    px = start_px
-    while px >= min_px:
-        f = get_font(px, bold=bold)
-        line_h = f.get_linesize()
-        total_h = line_h * len(lines)
-        widest = 0
-        for ln in lines:
-            widest = max(widest, f.size(ln)[0])
-        if widest <= max_w and total_h <= max_h:
-            return f
-        px -= 1
-    return get_font(min_px, bold=bold)
+    # memoizado por (linhas, retângulo, tamanhos) no registro de fontes
+    return FONTS.fit_multiline(lines, max_w, max_h, start_px, bold=bold, min_px=min_px)
 
 def draw_sidebar_button(surface, rect, label, *, hovered=False, selected=False):
     base = C_BLUE if (hovered or selected) else C_BLUE_DARK
@@ -396,7 +602,7 @@ def draw_sidebar_button(surface, rect, label, *, hovered=False, selected=False):
     y = rect.centery - total_h // 2
 
     for ln in lines:
-        img = f.render(ln, True, color)
+        img = render_text(f, ln, color)
         r = img.get_rect(center=(rect.centerx, y + line_h // 2))
         surface.blit(img, r)
         y += line_h
@@ -413,63 +619,87 @@ def draw_arrow(surface, rect, direction):
     pygame.draw.polygon(surface, C_YELLOW, pts)
 
 # -----------------------------
-# Background
+# App (inicialização preguiçosa)
 # -----------------------------
-def load_bg():
-    if os.path.exists(BG_IMAGE_PATH):
-        try:
-            img = pygame.image.load(BG_IMAGE_PATH).convert()
-            return pygame.transform.smoothscale(img, (WIDTH, HEIGHT))
-        except Exception:
-            return None
-    return None
+class App:
+    """
+    Faz a inicialização pesada só quando run() é chamado.
 
-# -----------------------------
-# Filtering + sorting
-# -----------------------------
-def build_view(news_all, active_category, filter_text):
-    ft = (filter_text or "").strip().lower()
+    O fetch inicial (rede/cache + normalize_data) roda numa thread em
+    paralelo com a abertura do display e a criação das fontes; start()
+    espera o fetch só no fim e guarda o tempo de cada etapa em `timings`.
+    Se o cache local estiver fora do TTL, `needs_revalidate` fica True e o
+    run() pede a revalidação em segundo plano.
+    """
 
-    if active_category == "Todas":
-        items = list(news_all)
-    else:
-        items = [n for n in news_all if n.get("category") == active_category]
+    def __init__(self):
+        self.timings = {}
+        self.needs_revalidate = False
 
-    if ft:
-        items = [n for n in items if ft in n.get("title", "").lower() or ft in n.get("description", "").lower()]
+    def _timed(self, name, fn):
+        t0 = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.timings[name] = time.perf_counter() - t0
+
+    def init_display(self) -> None:
+        global screen, WIDTH, HEIGHT
+        pygame.display.init()
+        pygame.display.set_caption("Noticias (Pygame Mock)")
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        WIDTH, HEIGHT = screen.get_size()
+        set_scale(WIDTH, HEIGHT)
+
+    def start(self) -> dict:
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup-fetch") as pool:
+            fetch = pool.submit(self._timed, "fetch", load_startup_data)
+            self._timed("display", self.init_display)
+            self._timed("fonts", init_fonts)
+            data, self.needs_revalidate = self._timed("fetch_wait", fetch.result)
+        self.timings["total"] = time.perf_counter() - t0
+        self.report()
+        return data
+
+    def report(self) -> None:
+        parts = " ".join(f"{k}={v * 1000:.0f}ms" for k, v in self.timings.items())
+        print(f"[STARTUP] {parts}")
 
-    # ordenação por data (mais recente primeiro) quando parseia
-    parse_ok = [n for n in items if n.get("_sort_key") is not None]
-    parse_no = [n for n in items if n.get("_sort_key") is None]
-    parse_ok.sort(key=lambda n: n["_sort_key"], reverse=True)
-    return parse_ok + parse_no
 
 # -----------------------------
 # Main app
 # -----------------------------
 def run():
+    app = App()
+    data = app.start()
+
     clock = pygame.time.Clock()
-    BG = load_bg()
+    # até o fundo ficar pronto, o backdrop usa cor sólida
+    BG = None
+    bg_loader = FetchWorker(lambda: load_scaled_bg(BG_IMAGE_PATH, (WIDTH, HEIGHT)), BG_LOADED, name="bg-load")
+    bg_loader.request("inicial")
 
-    data = fetch_data_remote_or_cache()
     coach_name = data["coach_name"]
     sidebar_date = data["sidebar_date"]
-    news_all = data["news"] or [{
-        "date": "—", "category": "Mensagens", "title": "Sem notícias", "description": "O JSON não contém notícias.", "_sort_key": None
-    }]
+    news_all = data["news"] or [placeholder_item("O JSON não contém notícias.")]
+    if data["news"]:
+        news_view = NewsView(news_all, data["_by_category"], data["_search"])
+    else:
+        news_view = NewsView(news_all)
 
-    # UI State
     # UI State
     current_mode = "NEWS"  # "NEWS" | "COMPETITIONS"
     comp_view = CompetitionsView("campeonato.json", Sx, Sy, Sf, get_font)
+    # simulação de temporada (pool de processos) fora da thread principal; só
+    # começa quando a tela de competições é aberta
+    sim_worker = FetchWorker(comp_view.simulate, SIM_DONE, name="season-sim")
 
     active_category = "Todas"
     filter_text = ""
     filter_active = False
 
     selected_news = 0
-    news_scroll = 0
-    visible_rows = 5
 
     # Hover
     hover_top = None
@@ -533,6 +763,31 @@ def run():
     list_panel = pygame.Rect(LIST_X, LIST_Y + LIST_HEADER_H, LIST_W, LIST_H - LIST_HEADER_H)
     scrollbar_rect = pygame.Rect(LIST_X + LIST_W - Sx(14), list_panel.top, Sx(14), list_panel.height)
 
+    def draw_news_row(surface, row_rect, item, is_sel, is_hov):
+        bgc = (25, 30, 90) if not is_sel else (140, 0, 0)
+        if is_hov and not is_sel:
+            bgc = (35, 45, 130)
+
+        pygame.draw.rect(surface, bgc, row_rect)
+        pygame.draw.rect(surface, (255, 210, 45) if is_sel else (80, 120, 255), row_rect, max(1, Sx(1)))
+
+        chip = pygame.Rect(row_rect.left, row_rect.top, Sx(130), row_rect.height)
+        pygame.draw.rect(surface, (5, 15, 65), chip)
+        pygame.draw.rect(surface, (80, 120, 255), chip, max(1, Sx(1)))
+        draw_text(surface, item.date, FONT_12, C_WHITE, chip, align="center")
+
+        title_rect2 = pygame.Rect(chip.right + Sx(8), row_rect.top, row_rect.width - chip.width - Sx(8), row_rect.height)
+        draw_text(surface, item.title, FONT_12, C_WHITE, title_rect2, align="midleft")
+
+    # linhas: só as visíveis são desenhadas (Surfaces em cache), rolagem em pixels
+    news_list = VirtualList(
+        list_panel, scrollbar_rect,
+        row_h=Sy(24), row_gap=Sy(2), pad=Sy(6),
+        inset_left=Sx(6), inset_right=Sx(28) - Sx(6),
+        min_thumb=Sy(24), thumb_inset=Sx(2), thumb_w=scrollbar_rect.width - Sx(4), border=max(1, Sx(1)),
+        render_row=draw_news_row,
+    )
+
     # --- Filtro (top-right) + Botão (abaixo) ---
     FILTER_H = clamp(Sy(20), 18, 26)
 
@@ -595,20 +850,58 @@ def run():
     # -----------------------------
     # Data refresh helpers
     # -----------------------------
+    fetcher = FetchWorker(lambda: fetch_data_remote_or_cache(on_partial=post_feed_partial))
+    current_data = data
+    if app.needs_revalidate:
+        fetcher.request("revalidar")
+
     def refresh_json(reason: str = ""):
-        nonlocal coach_name, sidebar_date, news_all
-        try:
-            d = fetch_data_remote_or_cache()
-            coach_name = d["coach_name"]
-            sidebar_date = d["sidebar_date"]
-            news_all = d["news"] or [{
-                "date": "—", "category": "Mensagens", "title": "Sem notícias", "description": "O JSON não contém notícias.", "_sort_key": None
-            }]
-            # atualiza texto do menu do lado (coach)
-            SB_MENU[1] = coach_name
-            print(f"[JSON] Atualizado ({reason}) | itens={len(news_all)}")
-        except Exception as e:
-            print("[JSON] Erro ao atualizar:", e)
+        # não bloqueia o loop: o resultado chega como evento FEED_LOADED
+        fetcher.request(reason)
+
+    def apply_json(event):
+        nonlocal coach_name, sidebar_date, news_all, current_data, selected_news
+        reason = ",".join(event.reasons)
+        if event.error is not None:
+            print("[JSON] Erro ao atualizar:", event.error)
+            return
+        d = event.data
+        if d is current_data:
+            # cache dentro do TTL ou 304: nada mudou
+            return
+        # a seleção segue o mesmo item (por id), não a mesma posição
+        view = current_view()
+        selected_id = view[selected_news].id if 0 <= selected_news < len(view) else None
+
+        delta = d.get("_delta")
+        incremental = delta is not None and delta.base is current_data and current_data["news"] and d["news"]
+        current_data = d
+        coach_name = d["coach_name"]
+        sidebar_date = d["sidebar_date"]
+        news_all = d["news"] or [placeholder_item("O JSON não contém notícias.")]
+        # atualiza texto do menu do lado (coach)
+        SB_MENU[1] = coach_name
+        if incremental:
+            news_view.apply_delta(news_all, d["_by_category"], d["_search"], delta)
+        elif d["news"]:
+            news_view.set_data(news_all, d["_by_category"], d["_search"])
+        else:
+            news_view.set_data(news_all)
+        if delta is not None:
+            delta.base = None  # não segura o store antigo
+
+        if selected_id is not None:
+            view = current_view()
+            for i, n in enumerate(view):
+                if n.id == selected_id:
+                    selected_news = i
+                    ensure_selected_visible(view)
+                    break
+        changes = f" | delta {delta!r}" if incremental else ""
+        print(f"[JSON] Atualizado ({reason}) | itens={len(news_all)}{changes}")
+
+    # eventos vão para o diário em disco; o envio (com retry) é em segundo plano
+    outbox = WebhookOutbox(WEBHOOK_URL, http_post_json)
 
     def post_continue_webhook():
         payload = {
@@ -618,47 +911,37 @@ def run():
             "filter_text": filter_text,
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
-        try:
-            status, txt = http_post_json(WEBHOOK_URL, payload)
-            print(f"[WEBHOOK] POST status={status}")
-            if txt:
-                print("[WEBHOOK] response:", txt[:300])
-        except Exception as e:
-            print("[WEBHOOK] Falha POST:", e)
+        outbox.enqueue(payload)
 
     # -----------------------------
     # UI helpers
     # -----------------------------
     def current_view():
-        return build_view(news_all, active_category, filter_text)
-
-    def clamp_scroll(view):
-        nonlocal news_scroll
-        max_scroll = max(0, len(view) - visible_rows)
-        news_scroll = max(0, min(news_scroll, max_scroll))
+        return news_view.get(active_category, filter_text)
 
     def ensure_selected_visible(view):
-        nonlocal news_scroll
         if not view:
             return
-        if selected_news < news_scroll:
-            news_scroll = selected_news
-        elif selected_news >= news_scroll + visible_rows:
-            news_scroll = selected_news - visible_rows + 1
-        clamp_scroll(view)
+        news_list.ensure_visible(selected_news, len(view))
 
     def reset_selection(view):
-        nonlocal selected_news, news_scroll
+        nonlocal selected_news
         selected_news = 0
-        news_scroll = 0
-        clamp_scroll(view)
+        news_list.reset()
 
     def on_wheel(mouse_pos, y_delta):
-        nonlocal news_scroll
         view = current_view()
         if in_rect(mouse_pos, list_panel):
-            news_scroll -= y_delta
-            clamp_scroll(view)
+            news_list.scroll_rows(-y_delta, len(view))
+
+    def page_selection(direction):
+        # PageUp/PageDown: a seleção anda uma página (as linhas que cabem no painel)
+        nonlocal selected_news
+        view = current_view()
+        if not view:
+            return
+        selected_news = clamp(selected_news + direction * news_list.page_rows, 0, len(view) - 1)
+        ensure_selected_visible(view)
 
     def category_is_active(label):
         return active_category == label
@@ -686,23 +969,7 @@ def run():
                 hover_sb = i
                 break
 
-        view = current_view()
-        if in_rect(mouse_pos, list_panel) and view:
-            row_h = Sy(24)
-            row_gap = Sy(2)
-            for i in range(visible_rows):
-                idx = news_scroll + i
-                if idx >= len(view):
-                    break
-                row_rect = pygame.Rect(
-                    list_panel.left + Sx(6),
-                    list_panel.top + Sy(6) + i * (row_h + row_gap),
-                    list_panel.width - Sx(28),
-                    row_h
-                )
-                if in_rect(mouse_pos, row_rect):
-                    hover_news = idx
-                    break
+        hover_news = news_list.row_at(mouse_pos, len(current_view()))
 
     def click(mouse_pos):
         nonlocal active_category, selected_news, filter_active, current_mode
@@ -718,6 +985,8 @@ def run():
                     current_mode = "NEWS"
                 elif i == 2:
                     current_mode = "COMPETITIONS"
+                    if comp_view.needs_odds():
+                        sim_worker.request("competicoes")
                     # Opcional: recarregar dados se precisar
                     # comp_view.reload() 
                 return
@@ -746,6 +1015,10 @@ def run():
                     reset_selection(v)
                     return
 
+            # scrollbar: arrastar o thumb / paginar
+            if news_list.press(mouse_pos, len(current_view())):
+                return
+
             # news rows
             if hover_news is not None:
                 # (opcional) atualizar JSON ao clicar numa notícia
@@ -755,8 +1028,7 @@ def run():
                     selected_news = min(hover_news, len(v) - 1)
                     ensure_selected_visible(v)
                 else:
-                    selected_news = 0
-                    news_scroll = 0
+                    reset_selection(v)
                 return
 
             # read next
@@ -773,33 +1045,88 @@ def run():
         elif current_mode == "COMPETITIONS":
             comp_view.handle_input(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": mouse_pos, "button": 1}))
 
-    def render():
-        # Background
+    # -----------------------------
+    # Backdrop (camadas estáticas pré-compostas)
+    # -----------------------------
+    backdrop = None
+    backdrop_key = None
+    bg_version = 0
+
+    def compose_backdrop():
+        # fundo + overlay + painéis estáticos/translúcidos numa única Surface convertida
+        surf = pygame.Surface(screen.get_size()).convert()
         if BG:
-            screen.blit(BG, (0, 0))
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            surf.blit(BG, (0, 0))
+            overlay = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 90))
-            screen.blit(overlay, (0, 0))
+            surf.blit(overlay, (0, 0))
         else:
-            screen.fill((10, 10, 10))
+            surf.fill((10, 10, 10))
 
         # Sidebar
-        pygame.draw.rect(screen, C_BLUE_DARK, pygame.Rect(0, 0, SIDEBAR_W, HEIGHT))
-        pygame.draw.rect(screen, C_BLUE_BRIGHT, pygame.Rect(0, 0, SIDEBAR_W, HEIGHT), max(1, Sx(2)))
+        pygame.draw.rect(surf, C_BLUE_DARK, pygame.Rect(0, 0, SIDEBAR_W, HEIGHT))
+        pygame.draw.rect(surf, C_BLUE_BRIGHT, pygame.Rect(0, 0, SIDEBAR_W, HEIGHT), max(1, Sx(2)))
+
+        beveled_panel(surf, DATE_RECT, (12, 30, 130), C_YELLOW, C_BLACK, radius=max(2, Sx(4)))
+        draw_arrow(surf, arrow_left, "left")
+        draw_arrow(surf, arrow_right, "right")
+
+        # Main frame
+        pygame.draw.rect(surf, C_BLACK, main_frame)
+        pygame.draw.rect(surf, (255, 0, 0), main_frame, max(1, Sx(2)))
+
+        if current_mode == "COMPETITIONS":
+            comp_view.draw_backdrop(surf, main_frame)
+            # base das Surfaces por rodada; o cache vale enquanto o fundo/tamanho não mudar
+            comp_view.set_backdrop(surf, (bg_version, surf.get_size()))
+            return surf
+
+        # Title
+        beveled_panel(surf, title_rect, C_RED, (255, 80, 80), C_BLACK, radius=max(2, Sx(3)))
+
+        # List panel
+        panel_surf = pygame.Surface((list_panel.width, list_panel.height), pygame.SRCALPHA)
+        panel_surf.fill(C_PANEL)
+        surf.blit(panel_surf, list_panel.topleft)
+        pygame.draw.rect(surf, (255, 80, 80), list_panel, max(1, Sx(1)))
+
+        # Content area
+        content_surf = pygame.Surface((content_rect.width, content_rect.height), pygame.SRCALPHA)
+        content_surf.fill(C_PANEL_2)
+        surf.blit(content_surf, content_rect.topleft)
+        pygame.draw.rect(surf, C_WHITE, content_rect, max(1, Sx(1)))
 
-        beveled_panel(screen, DATE_RECT, (12, 30, 130), C_YELLOW, C_BLACK, radius=max(2, Sx(4)))
+        # Nav buttons
+        pygame.draw.rect(surf, (170, 170, 170), btn_prev_rect)
+        pygame.draw.rect(surf, C_BLACK, btn_prev_rect, max(1, Sx(2)))
+        draw_text(surf, "Atrás", FONT_22, (240, 240, 240), btn_prev_rect, align="center")
+
+        pygame.draw.rect(surf, (150, 150, 150), btn_next_rect)
+        pygame.draw.rect(surf, C_BLACK, btn_next_rect, max(1, Sx(2)))
+        draw_text(surf, "Seguinte", FONT_22, (240, 240, 240), btn_next_rect, align="center")
+        return surf
+
+    def get_backdrop():
+        # reconstrói só no F5 (bg_version), troca de resolução ou troca de modo
+        nonlocal backdrop, backdrop_key
+        key = (current_mode, bg_version, screen.get_size())
+        if key != backdrop_key:
+            backdrop = compose_backdrop()
+            backdrop_key = key
+        return backdrop
+
+    def render():
+        # Background + painéis estáticos
+        screen.blit(get_backdrop(), (0, 0))
 
         # Date text
         lines = str(sidebar_date).split("\n")
         y = DATE_RECT.top + Sy(8)
         for ln in lines:
-            img = FONT_14.render(ln, True, C_YELLOW)
+            img = render_text(FONT_14, ln, C_YELLOW)
             screen.blit(img, (DATE_RECT.left + Sx(48), y))
             y += Sy(18)
 
-        draw_arrow(screen, arrow_left, "left")
-        draw_arrow(screen, arrow_right, "right")
-
         for i, r in enumerate(sb_btn_rects):
             draw_sidebar_button(
                 screen,
@@ -809,16 +1136,11 @@ def run():
                 selected=(i == 6),
             )
 
-        # Main frame
-        pygame.draw.rect(screen, C_BLACK, main_frame)
-        pygame.draw.rect(screen, (255, 0, 0), main_frame, max(1, Sx(2)))
-
         if current_mode == "COMPETITIONS":
             comp_view.render(screen, main_frame)
             return
 
         # Title
-        beveled_panel(screen, title_rect, C_RED, (255, 80, 80), C_BLACK, radius=max(2, Sx(3)))
         draw_text(screen, f"Notícias para {coach_name}", FONT_28, C_WHITE, title_rect, align="center")
 
         # Top tabs
@@ -843,17 +1165,14 @@ def run():
         fnt = FONT_14
         while fnt.size(show + "|")[0] > max_px and len(show) > 0:
             show = show[1:]
-        caret = "|" if filter_active and (pygame.time.get_ticks() // 400) % 2 == 0 else ""
-        img = fnt.render(show + caret, True, C_WHITE)
+        caret = "|" if caret_visible() else ""
+        img = render_text(fnt, show + caret, C_WHITE)
         screen.blit(img, (filter_input_rect.left + Sx(8), filter_input_rect.centery - img.get_height() // 2))
 
         # view
         view = current_view()
         if not view:
-            view = [{
-                "date": "—", "category": "Mensagens", "title": "Sem notícias",
-                "description": "Sem itens nesta categoria/filtro.", "_sort_key": None
-            }]
+            view = [placeholder_item("Sem itens nesta categoria/filtro.")]
 
         # safety selection/scroll
         nonlocal_sel = False
@@ -862,92 +1181,27 @@ def run():
         else:
             selected_news_local = selected_news
 
-        max_scroll = max(0, len(view) - visible_rows)
-        if news_scroll > max_scroll:
-            news_scroll_local = max_scroll
-        else:
-            news_scroll_local = news_scroll
-
         # List header
         sel_idx = min(selected_news_local, len(view) - 1)
-        sel_title = view[sel_idx]["title"]
+        sel_title = view[sel_idx].title
 
         beveled_panel(screen, list_header, C_RED_DARK, (255, 80, 80), C_BLACK, radius=max(2, Sx(2)))
         draw_text(screen, sel_title, FONT_14, C_WHITE, list_header, align="midleft")
 
-        # List panel
-        panel_surf = pygame.Surface((list_panel.width, list_panel.height), pygame.SRCALPHA)
-        panel_surf.fill(C_PANEL)
-        screen.blit(panel_surf, list_panel.topleft)
-        pygame.draw.rect(screen, (255, 80, 80), list_panel, max(1, Sx(1)))
-
-        # Rows
-        row_h = Sy(24)
-        row_gap = Sy(2)
-        chip_w = Sx(130)
-
-        for i in range(visible_rows):
-            idx = news_scroll_local + i
-            if idx >= len(view):
-                break
-            item = view[idx]
-            date = item["date"]
-            title = item["title"]
-
-            row_rect = pygame.Rect(
-                list_panel.left + Sx(6),
-                list_panel.top + Sy(6) + i * (row_h + row_gap),
-                list_panel.width - Sx(28),
-                row_h
-            )
-
-            is_sel = (idx == sel_idx)
-            is_hov = (hover_news == idx)
-
-            bgc = (25, 30, 90) if not is_sel else (140, 0, 0)
-            if is_hov and not is_sel:
-                bgc = (35, 45, 130)
-
-            pygame.draw.rect(screen, bgc, row_rect)
-            pygame.draw.rect(screen, (255, 210, 45) if is_sel else (80, 120, 255), row_rect, max(1, Sx(1)))
-
-            chip = pygame.Rect(row_rect.left, row_rect.top, chip_w, row_rect.height)
-            pygame.draw.rect(screen, (5, 15, 65), chip)
-            pygame.draw.rect(screen, (80, 120, 255), chip, max(1, Sx(1)))
-            draw_text(screen, date, FONT_12, C_WHITE, chip, align="center")
-
-            title_rect2 = pygame.Rect(chip.right + Sx(8), row_rect.top, row_rect.width - chip.width - Sx(8), row_rect.height)
-            draw_text(screen, title, FONT_12, C_WHITE, title_rect2, align="midleft")
-
-        # Scrollbar
-        pygame.draw.rect(screen, (40, 40, 40), scrollbar_rect)
-        pygame.draw.rect(screen, (120, 120, 120), scrollbar_rect, max(1, Sx(1)))
-
-        thumb_h = max(Sy(24), int(scrollbar_rect.height * (visible_rows / max(visible_rows, len(view)))))
-        max_scroll2 = max(0, len(view) - visible_rows)
-        t = 0 if max_scroll2 == 0 else news_scroll_local / max_scroll2
-        thumb_y = scrollbar_rect.top + int((scrollbar_rect.height - thumb_h) * t)
-        thumb = pygame.Rect(scrollbar_rect.left + Sx(2), thumb_y, scrollbar_rect.width - Sx(4), thumb_h)
-        pygame.draw.rect(screen, (180, 180, 180), thumb)
-        pygame.draw.rect(screen, C_BLACK, thumb, max(1, Sx(1)))
+        # Rows + scrollbar (só as linhas visíveis)
+        news_list.draw(screen, view, sel_idx, hover_news)
 
         # Read next button
         pygame.draw.rect(screen, (200, 200, 200) if hover_read_next else (180, 180, 180), read_next_rect)
         pygame.draw.rect(screen, C_BLACK, read_next_rect, max(1, Sx(2)))
         draw_text(screen, "Ler Próxima", FONT_14, (20, 20, 20), read_next_rect, align="center")
 
-        # Content area
-        content_surf = pygame.Surface((content_rect.width, content_rect.height), pygame.SRCALPHA)
-        content_surf.fill(C_PANEL_2)
-        screen.blit(content_surf, content_rect.topleft)
-        pygame.draw.rect(screen, C_WHITE, content_rect, max(1, Sx(1)))
-
         # Content title
-        title_img = FONT_22.render(sel_title, True, C_YELLOW)
+        title_img = render_text(FONT_22, sel_title, C_YELLOW)
         screen.blit(title_img, (content_rect.left + Sx(16), content_rect.top + Sy(18)))
 
         # Description wrapped
-        desc = view[sel_idx]["description"]
+        desc = view[sel_idx].description
         body_x = content_rect.left + Sx(16)
         body_y = content_rect.top + Sy(72)
         body_w = content_rect.width - Sx(32)
@@ -972,40 +1226,98 @@ def run():
                 small=True
             )
 
-        # Nav buttons
-        pygame.draw.rect(screen, (170, 170, 170), btn_prev_rect)
-        pygame.draw.rect(screen, C_BLACK, btn_prev_rect, max(1, Sx(2)))
-        draw_text(screen, "Atrás", FONT_22, (240, 240, 240), btn_prev_rect, align="center")
-
-        pygame.draw.rect(screen, (150, 150, 150), btn_next_rect)
-        pygame.draw.rect(screen, C_BLACK, btn_next_rect, max(1, Sx(2)))
-        draw_text(screen, "Seguinte", FONT_22, (240, 240, 240), btn_next_rect, align="center")
+    # -----------------------------
+    # Dirty regions
+    # -----------------------------
+    sidebar_rect = pygame.Rect(0, 0, SIDEBAR_W, HEIGHT)
+    top_tabs_area = top_tab_rects[0].unionall(top_tab_rects[1:])
+    bottom_tabs_area = bottom_tab_rects[0].unionall(bottom_tab_rects[1:])
+    filter_area = filter_label_rect.union(filter_input_rect)
+    list_area = list_header.union(list_panel)
+    dirty_tracker = DirtyRegions()
+    # a janela perdeu o conteúdo (exposta, restaurada, redimensionada): o
+    # próximo frame tem que ser inteiro, senão fica lixo até algo mudar
+    redraw_events = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED,
+                     pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+    def caret_visible():
+        return filter_active and (pygame.time.get_ticks() // 400) % 2 == 0
+
+    def frame_regions():
+        # (nome, rect, assinatura): a região só é redesenhada quando a assinatura muda
+        regions = [
+            ("scene", screen.get_rect(), (current_mode, bg_version)),
+            ("sidebar", sidebar_rect, (hover_sb, sidebar_date, tuple(SB_MENU))),
+        ]
+        if current_mode == "COMPETITIONS":
+            regions.append(("competitions", main_frame, (comp_view.current_round, comp_view.hover_prev, comp_view.hover_next,
+                                                         comp_view.standings.version, comp_view.show_table,
+                                                         comp_view.hover_toggle, comp_view.odds_version)))
+            return regions
+
+        data_key = (news_view.stamp(active_category, filter_text), active_category, filter_text)
+        regions += [
+            ("title", title_rect, (coach_name,)),
+            ("top_tabs", top_tabs_area, (hover_top, active_category)),
+            ("filter", filter_area, (filter_text, caret_visible())),
+            ("list", list_area, (data_key, selected_news, news_list.scroll_px, hover_news, news_list.dragging)),
+            ("read_next", read_next_rect, (hover_read_next,)),
+            ("content", content_rect, (data_key, selected_news)),
+            ("bottom_tabs", bottom_tabs_area, (hover_bottom, active_category)),
+        ]
+        return regions
 
     # initial refresh (already done by fetch_data_remote_or_cache)
     # main loop
     running = True
     while running:
-        clock.tick(FPS)
+        dt = clock.tick(FPS) / 1000.0
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
+            elif event.type in redraw_events:
+                dirty_tracker.invalidate()
+
+            elif event.type == FEED_LOADED:
+                apply_json(event)
+
+            elif event.type == FEED_PARTIAL:
+                # primeira tela de um download em andamento: só se ainda não há notícias
+                if not current_data["news"]:
+                    apply_json(event)
+
+            elif event.type == BG_LOADED:
+                if event.error is not None:
+                    print("[BG] Falha ao carregar:", event.error)
+                BG = event.data.convert() if event.data is not None else None
+                bg_version += 1
+
+            elif event.type == SIM_DONE:
+                if event.error is not None:
+                    print("[SIM] Falha na simulação:", event.error)
+                elif comp_view.set_odds(event.data):
+                    print(f"[SIM] {event.data['runs']} temporadas em {event.data['seconds']:.2f}s")
+                elif comp_view.needs_odds():
+                    sim_worker.request("resultado_desatualizado")
+
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
                 elif event.key == pygame.K_r:
-                    refresh_json("tecla_r")
-                    selected_news = 0
-                    news_scroll = 0
+                    expire_cache()
+                    refresh_json("tecla_r")  # seleção e scroll seguem o item em apply_json
                 elif event.key == pygame.K_F5:
-                    BG = load_bg()
+                    bg_loader.request("f5")
+                elif event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN) and current_mode == "NEWS":
+                    page_selection(1 if event.key == pygame.K_PAGEDOWN else -1)
                 else:
                     if filter_active:
                         if event.key == pygame.K_BACKSPACE:
                             filter_text = filter_text[:-1]
                             selected_news = 0
-                            news_scroll = 0
+                            news_list.reset()
                         elif event.key == pygame.K_RETURN:
                             filter_active = False
                         else:
@@ -1013,14 +1325,19 @@ def run():
                             if ch and ch.isprintable():
                                 filter_text += ch
                                 selected_news = 0
-                                news_scroll = 0
+                                news_list.reset()
 
             elif event.type == pygame.MOUSEMOTION:
                 if current_mode == "COMPETITIONS":
                     comp_view.handle_input(event)
                 else:
+                    news_list.drag(event.pos, len(current_view()))
                     update_hover(event.pos)
 
+            elif event.type == pygame.MOUSEBUTTONUP:
+                if event.button == 1:
+                    news_list.release()
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     click(event.pos)
@@ -1033,24 +1350,53 @@ def run():
                 on_wheel(pygame.mouse.get_pos(), event.y)
 
         # safety: ajusta selection/scroll ao vivo
-        v = build_view(news_all, active_category, filter_text)
+        v = current_view()
         if not v:
-            v = [{
-                "date": "—", "category": "Mensagens", "title": "Sem notícias",
-                "description": "Sem itens nesta categoria/filtro.", "_sort_key": None
-            }]
+            v = [placeholder_item("Sem itens nesta categoria/filtro.")]
 
         if selected_news >= len(v):
             selected_news = 0
-            news_scroll = 0
-
-        max_scroll = max(0, len(v) - visible_rows)
-        if news_scroll > max_scroll:
-            news_scroll = max_scroll
-
-        render()
-        pygame.display.flip()
+            news_list.reset()
+        news_list.clamp(len(v))
 
+        # rolagem suave: avança o easing e, se a lista andou, a linha sob o mouse muda
+        if current_mode == "NEWS":
+            before = news_list.scroll_px
+            news_list.update(dt)
+            if news_list.scroll_px != before:
+                update_hover(pygame.mouse.get_pos())
+
+        # só redesenha (um render, com clip na união) e envia para a tela o que mudou
+        dirty = dirty_tracker.collect(frame_regions())
+        if dirty is None:
+            render()
+            pygame.display.flip()
+        elif dirty:
+            screen.set_clip(dirty[0].unionall(dirty[1:]))
+            render()
+            screen.set_clip(None)
+            pygame.display.update(dirty)
+        elif current_mode == "COMPETITIONS":
+            # frame ocioso: adianta as rodadas vizinhas para "<"/">" serem instantâneos
+            comp_view.prerender_idle(main_frame)
+
+    fetcher.stop()
+    bg_loader.stop()
+    sim_worker.stop()
+    outbox.stop()
+    HTTP_POOL.close()
+    hs = HTTP_POOL.stats()
+    print(f"[HTTP] requests={hs['requests']} reused={hs['reused']} opened={hs['connections_opened']} "
+          f"errors={hs['errors']} avg_latency={hs['avg_latency_ms']:.0f}ms")
+    st = TEXT_CACHE.stats()
+    print(f"[TEXT] cache hits={st['hits']} misses={st['misses']} hit_rate={st['hit_rate']:.1%} "
+          f"entries={st['entries']} bytes={st['bytes']}")
+    rs = comp_view.round_cache.stats()
+    print(f"[ROUNDS] cache hits={rs['hits']} misses={rs['misses']} hit_rate={rs['hit_rate']:.1%} "
+          f"entries={rs['entries']} bytes={rs['bytes']} evictions={rs['evictions']} too_big={rs['too_big']}")
+    ls = news_list.stats()
+    print(f"[LIST] row cache hits={ls['hits']} misses={ls['misses']} hit_rate={ls['hit_rate']:.1%} "
+          f"entries={ls['entries']} bytes={ls['bytes']}")
     pygame.quit()
 
 # ---------- Entry ----------
@@ -0,0 +1,208 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+from http_pool import HTTPStatusError
+
+OUTBOX_PATH = "webhook_outbox.jsonl"
+
+BATCH_MAX = 20
+BACKOFF_BASE_SEC = 1.0
+BACKOFF_MAX_SEC = 300.0
+
+
+class WebhookOutbox:
+    """
+    Fila durável de eventos para o webhook.
+
+    enqueue() só põe o evento na fila em memória e acorda a thread daemon,
+    que grava no diário em disco (uma linha JSON por evento, um fsync por
+    leva) antes de enviar em lotes de até `batch_max` pela conexão
+    keep-alive do pool; stop() grava o que ainda não foi para o diário.
+    Nenhum acesso a disco acontece com _cond travado: quem chama enqueue()
+    (a UI) nunca espera por fsync. Falhas de rede ou 5xx/408/429 entram em
+    backoff exponencial (com jitter); outros 4xx são descartados para não
+    travar a fila. Depois de cada lote o diário é reescrito (atomicamente)
+    só com o que falta enviar, e o que sobrar é reenviado no próximo startup.
+    Cada evento leva um "event_id" para o receptor poder deduplicar.
+    """
+
+    def __init__(self, url: str, send_fn, path: str = OUTBOX_PATH, batch_max: int = BATCH_MAX,
+                 backoff_base: float = BACKOFF_BASE_SEC, backoff_max: float = BACKOFF_MAX_SEC):
+        self.url = url
+        self.send_fn = send_fn  # send_fn(url, payload) -> (status, texto)
+        self.path = path
+        self.batch_max = batch_max
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # serializa o diário; pegar antes de _cond, nunca depois
+        self._pending = self._load_journal()
+        self._unjournaled = []  # enfileirados e ainda não gravados no diário
+        self._failures = 0
+        self._retry_at = 0.0
+        self._stopped = False
+
+        self.sent = 0
+        self.dropped = 0
+
+        if self._pending:
+            print(f"[WEBHOOK] {len(self._pending)} evento(s) pendente(s) do diário")
+
+        self._thread = threading.Thread(target=self._loop, name="webhook-outbox", daemon=True)
+        self._thread.start()
+
+    # -------- diário --------
+    def _load_journal(self) -> list:
+        events = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        ev = json.loads(line)
+                    except ValueError:
+                        continue  # linha truncada por queda no meio da escrita
+                    if isinstance(ev, dict):
+                        ev.setdefault("event_id", uuid.uuid4().hex)
+                        events.append(ev)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("[WEBHOOK] Falha ao ler diário:", e)
+        return events
+
+    def _append_journal(self, events: list) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for ev in events:
+                f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite_journal(self, events: list) -> None:
+        if not events:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for ev in events:
+                f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def _flush_journal(self) -> None:
+        """Grava no diário os eventos enfileirados desde a última gravação."""
+        with self._io_lock:
+            with self._cond:
+                events, self._unjournaled = self._unjournaled, []
+            if not events:
+                return
+            try:
+                self._append_journal(events)
+            except Exception as e:
+                print("[WEBHOOK] Falha ao gravar diário:", e)
+
+    def _compact_journal(self) -> None:
+        """Reescreve o diário só com os pendentes (cópia tirada sob _cond, gravada fora dele)."""
+        with self._io_lock:
+            with self._cond:
+                events = list(self._pending)
+                fresh, self._unjournaled = self._unjournaled, []  # a reescrita já inclui esses
+            try:
+                self._rewrite_journal(events)
+            except Exception as e:
+                print("[WEBHOOK] Falha ao compactar diário:", e)
+                with self._cond:
+                    self._unjournaled = fresh + self._unjournaled
+
+    # -------- API --------
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def enqueue(self, payload: dict) -> None:
+        event = dict(payload)
+        event.setdefault("event_id", uuid.uuid4().hex)
+        with self._cond:
+            self._pending.append(event)
+            self._unjournaled.append(event)
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._flush_journal()  # o que a thread não chegou a gravar
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"pending": len(self._pending), "sent": self.sent, "dropped": self.dropped,
+                    "failures": self._failures}
+
+    # -------- envio --------
+    def _is_permanent(self, err) -> bool:
+        return isinstance(err, HTTPStatusError) and 400 <= err.status < 500 and err.status not in (408, 429)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._stopped and not self._unjournaled:
+                    wait = self._retry_at - time.monotonic()
+                    if self._pending and wait <= 0:
+                        break
+                    self._cond.wait(wait if self._pending else None)
+                if self._stopped:
+                    return
+                journal = bool(self._unjournaled)
+                batch = self._pending[:self.batch_max]
+            if journal:
+                # grava antes de enviar: o que sai pela rede já está no diário
+                self._flush_journal()
+                continue
+
+            done = set()
+            dropped = 0
+            error = None
+            for ev in batch:
+                try:
+                    status, txt = self.send_fn(self.url, ev)
+                    print(f"[WEBHOOK] POST status={status}")
+                    if txt:
+                        print("[WEBHOOK] response:", txt[:300])
+                    done.add(ev["event_id"])
+                except Exception as e:
+                    if self._is_permanent(e):
+                        print("[WEBHOOK] Evento descartado:", e)
+                        done.add(ev["event_id"])
+                        dropped += 1
+                        continue
+                    error = e
+                    break
+
+            with self._cond:
+                if done:
+                    self.sent += len(done) - dropped
+                    self.dropped += dropped
+                    self._pending = [ev for ev in self._pending if ev.get("event_id") not in done]
+                if error is None:
+                    self._failures = 0
+                    self._retry_at = 0.0
+                else:
+                    self._failures += 1
+                    delay = min(self.backoff_max, self.backoff_base * (2 ** (self._failures - 1)))
+                    delay *= 1.0 + random.random() * 0.5
+                    self._retry_at = time.monotonic() + delay
+                    print(f"[WEBHOOK] Falha POST: {error} | {len(self._pending)} pendente(s), nova tentativa em {delay:.0f}s")
+            if done:
+                self._compact_journal()